@@ -11,38 +11,129 @@ Endpoint: POST /agent/request
 
 from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from typing import Optional
 from pydantic import BaseModel
+from cachetools import TLRUCache, TTLCache
 import asyncio
-import json
-from datetime import datetime
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import accumulate
+from pathlib import Path
+from types import MappingProxyType
+
+import httpx
+import orjson
+import yaml
 
 # Import from partner's track
-from backend.core.identity import validate_token, Identity
-from backend.core.router import route_request
+from backend.core.identity import validate_token_async, Identity, close_identity_clients
+from backend.core.router import route_request_async
 
 # Import from our track
-from backend.core.agents import execute_agent, AgentRequest
+from backend.core.agents import execute_agent, AgentRequest, warm_agent_caches
+from backend.core import demo_runner
+from backend.core.demo_runner import AGENT_SPAWN_STAGGER_MS, sse_event
 
 # CloudWatch metrics integration
 from backend.tools.cloudwatch_metrics import (
-    push_threat_metric,
-    push_honeypot_engagement,
-    push_fingerprint_captured,
+    MetricBatcher,
+    _get_cloudwatch_client,
+    build_threat_metrics,
+    build_honeypot_engagement_metric,
+    build_fingerprint_metric,
+    build_evolution_metrics,
     record_attack_survived,
     get_evolution_stats,
     reset_evolution_stats,
 )
 
 # Attack intelligence query
-from backend.tools.intel_query import query_attack_intel
+from backend.tools.intel_query import query_attack_intel, _get_kb_client, KNOWLEDGE_BASE_ID
 
-# Demo state
-demo_running = False
-demo_stop_flag = False
-demo_fingerprints_captured = 0
-demo_honeypots_engaged = 0
+# Visual honeytokens (Freepik) - optional, the endpoint falls back to a placeholder
+try:
+    from backend.tools.visual_honeytoken import generate_visual_honeytoken
+    from backend.integrations.freepik import close_http_clients
+except ImportError:
+    generate_visual_honeytoken = None
+    close_http_clients = None
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+logger = logging.getLogger(__name__)
+
+# The startup banner is INFO and must show however the server is launched;
+# the uvicorn CLI never configures the root logger, so this logger gets its
+# own handler. Library loggers (botocore, ...) stay at WARNING.
+logger.setLevel(logging.INFO)
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+AGENTS_CONFIG = ROOT / "config" / "agents.yaml"
+FINGERPRINTS_LOG = ROOT / "logs" / "fingerprints.jsonl"
+ATTACKS_LOG = ROOT / "logs" / "attacks.jsonl"
+
+# Browser origins allowed to call the API directly (comma-separated).
+# The dev dashboard goes through the vite proxy and needs no CORS at all.
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv(
+        "FRONTEND_ORIGIN", "http://localhost:5173,http://localhost:3000"
+    ).split(",")
+    if origin.strip()
+]
+
+# Token validation cache (keyed by SHA-256 of the Authorization header)
+# Invalid tokens get a shorter TTL so floods of bad tokens can't pin memory
+TOKEN_CACHE_TTL = 30
+
+
+def _token_ttu(_key, identity: "Identity", now: float) -> float:
+    """Keep a valid identity for TOKEN_CACHE_TTL, but never past the token's exp."""
+    expires = now + TOKEN_CACHE_TTL
+    exp = identity.raw_claims.get("exp")
+    if isinstance(exp, (int, float)):
+        expires = min(expires, exp)
+    return expires
+
+
+# Wall-clock timer so entries can be compared against the JWT exp claim
+_tok_cache = TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+_tok_neg_cache = TTLCache(maxsize=10_000, ttl=5)
+
+
+@dataclass
+class DemoState:
+    """Progress of one scripted demo run, owned by its generator."""
+    running: bool = False
+    # Set by /demo/stop; the generator's pauses wake on it immediately
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    # Task waiting on `stop`, shared by every pause of the run
+    stop_waiter: Optional[asyncio.Task] = None
+    fingerprints_captured: int = 0
+    honeypots_engaged: int = 0
+    # CloudWatch metrics buffered for the current phase, and in-flight sends
+    metrics: MetricBatcher = field(default_factory=MetricBatcher)
+    pending: list = field(default_factory=list)
+
+
+# State of the most recent scripted demo run (read by status endpoints)
+current_demo = DemoState()
 
 
 # ============================================================
@@ -52,18 +143,38 @@ demo_honeypots_engaged = 0
 app = FastAPI(
     title="HoneyAgent API",
     description="Deception-as-a-Service for Agent Networks",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware (for frontend)
+# CORS middleware (for frontend). A concrete allowlist keeps credentials
+# valid per spec and lets preflights return precomputed headers.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=FRONTEND_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip that passes the demo SSE streams through untouched.
+
+    Older Starlette releases buffer and compress text/event-stream too,
+    which would hold demo frames until the gzip buffer flushes.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/demo/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress the dashboard's JSON polls (/fingerprints, /attacks, ...)
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=1000, compresslevel=5)
+
 
 # ============================================================
 # HEALTH CHECK
@@ -79,6 +190,29 @@ async def health_check():
 # MAIN AGENT REQUEST ENDPOINT
 # ============================================================
 
+async def _cached_validate(token: Optional[str]) -> Identity:
+    """Validate a bearer token, reusing recent results for the same token."""
+    key = hashlib.sha256((token or "").encode()).digest()
+
+    identity = _tok_cache.get(key) or _tok_neg_cache.get(key)
+    if identity is not None:
+        return identity
+
+    identity = await validate_token_async(token)
+    if identity.valid:
+        _tok_cache[key] = identity
+    else:
+        _tok_neg_cache[key] = identity
+    return identity
+
+
+# Encoded once; returned by agent_request if the whole flow crashes
+_AGENT_REQUEST_FALLBACK = orjson.dumps({
+    "status": "acknowledged",
+    "response": "Request acknowledged. Processing in background."
+})
+
+
 @app.post("/agent/request")
 async def agent_request(
     request: AgentRequest,
@@ -100,30 +234,63 @@ async def agent_request(
         {"status": str, "response": str}
     """
     try:
-        # Step 1: Validate token
-        identity = validate_token(authorization)
+        # Step 1: Validate token (cached per token for a short TTL)
+        identity = await _cached_validate(authorization)
 
         # Step 2: Route to appropriate agent
-        agent_name = route_request(identity)
+        agent_name = await route_request_async(identity)
 
         # Step 3: Execute agent
-        response = await execute_agent(agent_name, request)
+        return await execute_agent(agent_name, request)
 
-        return response
-
-    except Exception as e:
+    except Exception:
         # Fallback: Never expose errors
         # Return plausible response even if entire flow crashes
-        return {
-            "status": "acknowledged",
-            "response": "Request acknowledged. Processing in background."
-        }
+        return Response(content=_AGENT_REQUEST_FALLBACK, media_type="application/json")
 
 
 # ============================================================
 # AGENT STATUS ENDPOINT (for demo)
 # ============================================================
 
+# Encoded /agents/status body, rebuilt only when agents.yaml changes
+_agents_cache = {"mtime": None, "body": None}
+
+# LibYAML's C loader when available, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _build_agents_payload(config_path: Path) -> dict:
+    """Parse agents.yaml into the /agents/status response (blocking)."""
+    with open(config_path) as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+
+    agents = []
+    for agent_key, agent_config in config["agents"].items():
+        agents.append({
+            "name": agent_config["name"],
+            "type": agent_key,
+            "description": agent_config.get("description", ""),
+            "is_honeypot": "honeypot" in agent_key
+        })
+
+    return {
+        "total": len(agents),
+        "agents": agents
+    }
+
+
+# Fallback for a missing or malformed agents.yaml
+_AGENTS_FALLBACK = orjson.dumps({
+    "total": 3,
+    "agents": [
+        {"name": "processor-001", "type": "real", "is_honeypot": False},
+        {"name": "db-admin-001", "type": "honeypot", "is_honeypot": True},
+        {"name": "privileged-proc-001", "type": "honeypot", "is_honeypot": True}
+    ]
+})
+
+
 @app.get("/agents/status")
 async def agents_status():
     """
@@ -131,75 +298,112 @@ async def agents_status():
 
     Returns list of agents with their types.
     """
-    from pathlib import Path
-    import yaml
-
     try:
-        config_path = Path(__file__).parent.parent.parent / "config" / "agents.yaml"
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-
-        agents = []
-        for agent_key, agent_config in config["agents"].items():
-            agents.append({
-                "name": agent_config["name"],
-                "type": agent_key,
-                "description": agent_config.get("description", ""),
-                "is_honeypot": "honeypot" in agent_key
-            })
-
-        return {
-            "total": len(agents),
-            "agents": agents
-        }
-    except Exception:
-        # Fallback
-        return {
-            "total": 3,
-            "agents": [
-                {"name": "processor-001", "type": "real", "is_honeypot": False},
-                {"name": "db-admin-001", "type": "honeypot", "is_honeypot": True},
-                {"name": "privileged-proc-001", "type": "honeypot", "is_honeypot": True}
-            ]
-        }
+        mtime = AGENTS_CONFIG.stat().st_mtime
+        if mtime != _agents_cache["mtime"]:
+            # File read + YAML parse run in a worker thread, once per change
+            payload = await asyncio.to_thread(_build_agents_payload, AGENTS_CONFIG)
+            _agents_cache["body"] = orjson.dumps(payload)
+            _agents_cache["mtime"] = mtime
+
+        return Response(content=_agents_cache["body"], media_type="application/json")
+    except (OSError, yaml.YAMLError, KeyError, TypeError, AttributeError):
+        # Missing, unreadable or malformed config
+        return Response(content=_AGENTS_FALLBACK, media_type="application/json")
 
 
 # ============================================================
 # FINGERPRINTS ENDPOINT (for demo)
 # ============================================================
 
-@app.get("/fingerprints")
-async def get_fingerprints():
+# Incremental read state per JSONL log: bytes consumed so far, running
+# entry count, and the raw bytes of the most recent entries. Reads happen in
+# worker threads, so updates are serialized by a lock.
+_jsonl_tails: dict = {}
+_jsonl_tails_lock = threading.Lock()
+
+
+def _read_jsonl_tail(path: Path, limit: int = 50) -> tuple[int, list[bytes]]:
     """
-    Get recent attacker fingerprints (for demo dashboard).
+    Return (total entries, last `limit` raw lines) for an append-only JSONL log.
 
-    Reads from logs/fingerprints.jsonl (local log).
+    Each returned line has been validated as JSON but is kept as the bytes
+    read from disk, so responses can be assembled without re-encoding.
+
+    Only bytes appended since the previous call are read and parsed, so a
+    dashboard polling a large log pays for new lines rather than the whole file.
+    Blocking - call via asyncio.to_thread from request handlers.
+    """
+    with _jsonl_tails_lock:
+        return _read_jsonl_tail_locked(path, limit)
+
+
+def _read_jsonl_tail_locked(path: Path, limit: int) -> tuple[int, list]:
+    """Body of _read_jsonl_tail; caller holds _jsonl_tails_lock."""
+    st = path.stat()
+    size = st.st_size
+    state = _jsonl_tails.get(path)
+    if (
+        state is None
+        or st.st_ino != state["inode"]
+        or size < state["offset"]
+        or state["tail"].maxlen != limit
+    ):
+        # First read, or the log was truncated/rotated - start over
+        state = {"inode": st.st_ino, "offset": 0, "total": 0, "tail": deque(maxlen=limit)}
+        _jsonl_tails[path] = state
+
+    if size > state["offset"]:
+        with open(path, "rb") as f:
+            f.seek(state["offset"])
+            data = f.read(size - state["offset"])
+
+        # Leave a partially written last line for the next call
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            state["total"] += 1
+            state["tail"].append(line)
+        state["offset"] += end
+
+    return state["total"], list(state["tail"])
+
+
+def _jsonl_tail_response(key: str, total: int, lines: list[bytes], accept: Optional[str]) -> Response:
+    """
+    Serve tail lines as {"total": N, key: [...]} JSON, or as NDJSON when the
+    client accepts application/x-ndjson. Both are spliced from the raw log
+    lines - nothing is re-serialized.
     """
-    from pathlib import Path
-    import json
+    if accept and "application/x-ndjson" in accept:
+        return Response(content=b"".join(line + b"\n" for line in lines), media_type="application/x-ndjson")
+
+    body = b'{"total":%d,"%s":[' % (total, key.encode()) + b",".join(lines) + b"]}"
+    return Response(content=body, media_type="application/json")
 
-    try:
-        log_file = Path(__file__).parent.parent.parent / "logs" / "fingerprints.jsonl"
 
-        if not log_file.exists():
-            return {"fingerprints": []}
+@app.get("/fingerprints")
+async def get_fingerprints(accept: Optional[str] = Header(None)):
+    """
+    Get recent attacker fingerprints (for demo dashboard).
 
-        fingerprints = []
-        with open(log_file) as f:
-            for line in f:
-                try:
-                    fingerprints.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
+    Reads from logs/fingerprints.jsonl (local log). Send
+    Accept: application/x-ndjson for one fingerprint per line.
+    """
+    if not FINGERPRINTS_LOG.exists():
+        return _jsonl_tail_response("fingerprints", 0, [], accept)
 
+    try:
         # Return most recent 50
-        return {
-            "total": len(fingerprints),
-            "fingerprints": fingerprints[-50:]
-        }
-    except Exception:
-        # Fallback
-        return {"fingerprints": []}
+        total, fingerprints = await asyncio.to_thread(_read_jsonl_tail, FINGERPRINTS_LOG, 50)
+    except (OSError, orjson.JSONDecodeError):
+        # Fallback - log removed or unreadable between the check and the read
+        return _jsonl_tail_response("fingerprints", 0, [], accept)
+
+    return _jsonl_tail_response("fingerprints", total, fingerprints, accept)
 
 
 # ============================================================
@@ -230,11 +434,10 @@ async def metrics_status():
 
     Returns current demo state metrics (can be expanded to query CloudWatch).
     """
-    global demo_fingerprints_captured, demo_honeypots_engaged
     return {
-        "fingerprints_captured": demo_fingerprints_captured,
-        "honeypots_engaged": demo_honeypots_engaged,
-        "demo_running": demo_running,
+        "fingerprints_captured": current_demo.fingerprints_captured,
+        "honeypots_engaged": current_demo.honeypots_engaged,
+        "demo_running": current_demo.running,
         "cloudwatch_namespace": "HoneyAgent",
         "evolution": get_evolution_stats(),
     }
@@ -249,8 +452,12 @@ class IntelQuery(BaseModel):
     query: str
 
 
+# Intel results keyed by normalized query text (case/whitespace-insensitive)
+_intel_cache = TTLCache(maxsize=1024, ttl=300)
+
+
 @app.post("/api/intel/query")
-async def intel_query(request: IntelQuery):
+async def intel_query(request: IntelQuery, no_cache: bool = False):
     """
     Query attack intelligence using natural language.
 
@@ -263,20 +470,24 @@ async def intel_query(request: IntelQuery):
     - "privilege escalation techniques"
     - "similar attacks to social engineering"
 
+    Pass ?no_cache=true to bypass the result cache (the fresh result
+    still refreshes it).
+
     Returns:
         Intelligence results with sources and relevance scores.
     """
-    try:
-        result = query_attack_intel(request.query)
-        return result
-    except Exception:
-        # Fallback response
-        return {
-            "source": "fallback",
-            "query": request.query,
-            "results": [],
-            "summary": "Intelligence query temporarily unavailable.",
-        }
+    key = " ".join(request.query.lower().split())
+    cached = None if no_cache else _intel_cache.get(key)
+    if cached is not None:
+        # Echo this caller's query text rather than the one that filled the cache
+        return {**cached, "query": request.query}
+
+    # query_attack_intel never raises (it falls back to demo intel itself)
+
+    # Bedrock KB / local log scan is blocking - keep it off the event loop
+    result = await asyncio.to_thread(query_attack_intel, request.query)
+    _intel_cache[key] = result
+    return result
 
 
 @app.get("/api/intel/status")
@@ -289,11 +500,7 @@ async def intel_status():
     - Local fingerprint logs
     - Demo intelligence database
     """
-    import os
-    from pathlib import Path
-
-    kb_id = os.environ.get("HONEYAGENT_KB_ID", "")
-    log_file = Path(__file__).parent.parent.parent / "logs" / "fingerprints.jsonl"
+    kb_id = KNOWLEDGE_BASE_ID
 
     return {
         "bedrock_kb": {
@@ -301,8 +508,8 @@ async def intel_status():
             "kb_id": kb_id if kb_id else None,
         },
         "local_fingerprints": {
-            "available": log_file.exists(),
-            "path": str(log_file),
+            "available": FINGERPRINTS_LOG.exists(),
+            "path": str(FINGERPRINTS_LOG),
         },
         "demo_intel": {
             "available": True,
@@ -315,6 +522,22 @@ async def intel_status():
 # FREEPIK VISUAL HONEYTOKEN ENDPOINT
 # ============================================================
 
+_PLACEHOLDER_IMAGE_URL = "https://placehold.co/800x600/1a1a2e/ff6b35?text=Architecture+Diagram"
+
+
+def _placeholder_honeytoken(asset_type: str) -> dict:
+    """Placeholder response when Freepik generation isn't available."""
+    return {
+        "success": True,
+        "data": {
+            "url": _PLACEHOLDER_IMAGE_URL,
+            "canary_id": f"img-{uuid.uuid4().hex[:12]}",
+            "asset_type": asset_type,
+            "source": "fallback"
+        }
+    }
+
+
 @app.post("/visual-honeytoken")
 async def generate_visual_honeytoken_endpoint(
     asset_type: str = "architecture_diagram"
@@ -325,29 +548,20 @@ async def generate_visual_honeytoken_endpoint(
     Creates fake "sensitive" images (diagrams, screenshots) that serve
     as trackable honeytokens. Each image has a unique canary_id.
     """
-    import sys
-    from pathlib import Path
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    if generate_visual_honeytoken is None:
+        return _placeholder_honeytoken(asset_type)
 
     try:
-        from backend.tools.visual_honeytoken import generate_visual_honeytoken
-        result = generate_visual_honeytoken(asset_type)
-        return {
-            "success": True,
-            "data": result
-        }
-    except Exception as e:
-        # Fallback response
-        import uuid
-        return {
-            "success": True,
-            "data": {
-                "url": "https://placehold.co/800x600/1a1a2e/ff6b35?text=Architecture+Diagram",
-                "canary_id": f"img-{uuid.uuid4().hex[:12]}",
-                "asset_type": asset_type,
-                "source": "fallback"
-            }
-        }
+        # Generation polls Freepik for a while; keep it off the event loop
+        result = await asyncio.to_thread(generate_visual_honeytoken, asset_type)
+    except (httpx.HTTPError, ValueError, KeyError):
+        # Freepik down, or a response we couldn't parse
+        return _placeholder_honeytoken(asset_type)
+
+    return {
+        "success": True,
+        "data": result
+    }
 
 
 # ============================================================
@@ -390,7 +604,7 @@ DEMO_SEQUENCE = [
             "mitre_id": "T1591.004",
             "embedding": "vec_7f3a9c2b... stored to S3 Vectors",
         },
-        "target_index": 0,
+        "target_agent_id": "honey-db",
     },
     # Phase 2: Probing
     {
@@ -414,7 +628,7 @@ DEMO_SEQUENCE = [
             "mitre_id": "T1082",
             "embedding": "vec_2d8e4f1a... stored to S3 Vectors",
         },
-        "target_index": 1,
+        "target_agent_id": "honey-priv",
     },
     # Phase 3: Credential Theft
     {
@@ -438,7 +652,7 @@ DEMO_SEQUENCE = [
             "mitre_id": "T1078.003",
             "embedding": "vec_9b2c7e3d... stored to S3 Vectors",
         },
-        "target_index": 2,
+        "target_agent_id": "honey-api",
     },
     # Phase 4: Data Exfiltration
     {
@@ -462,7 +676,7 @@ DEMO_SEQUENCE = [
             "mitre_id": "T1552.001",
             "embedding": "vec_4e6f8a2c... stored to S3 Vectors",
         },
-        "target_index": 3,
+        "target_agent_id": "honey-cred",
     },
     # Phase 5: Legitimate Agent - Shows the contrast at the end!
     {
@@ -481,251 +695,479 @@ DEMO_SEQUENCE = [
             "reason": "Valid token + FGA permission granted"
         },
         "intel": None,
-        "target_index": -1,  # Real agent (proc-001)
+        "target_agent_id": "proc-001",  # Real agent
     },
 ]
 
 
-def sse_event(event_type: str, data: dict) -> str:
-    """Format SSE event."""
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-
+# Lookups derived from the tables above, computed once at import. The index
+# is read-only; the agent dicts themselves stay plain because orjson encodes
+# them into frames below (mappingproxy isn't serializable).
+DEMO_AGENTS_BY_ID = MappingProxyType({agent["id"]: agent for agent in DEMO_AGENTS})
+DEMO_HONEYPOT_COUNT = sum(1 for agent in DEMO_AGENTS if agent["is_honeypot"])
 
-async def demo_event_generator():
-    """Generate SSE events for demo playback - shows routing decisions and intel capture."""
-    global demo_running, demo_stop_flag, demo_fingerprints_captured, demo_honeypots_engaged
-    demo_running = True
-    demo_stop_flag = False
-    demo_fingerprints_captured = 0
-    demo_honeypots_engaged = 0
+# Resolve each step's target once so the demo loop never does index math
+for _step in DEMO_SEQUENCE:
+    _step["target_agent"] = DEMO_AGENTS_BY_ID[_step["target_agent_id"]]
 
-    # Reset evolution stats for fresh demo
-    reset_evolution_stats()
 
-    # Push initial metrics to CloudWatch (IDLE state)
-    push_threat_metric(
-        threat_level="NONE",
-        fingerprints_captured=0,
-        honeypots_engaged=0,
-        attack_phase="IDLE",
-    )
-
-    try:
-        # Event: Demo starting
-        yield sse_event("demo_start", {
-            "message": "HoneyAgent Network initializing..."
-        })
-        await asyncio.sleep(1)
-
-        # Event: Spawn all agents
-        for i, agent in enumerate(DEMO_AGENTS):
-            if demo_stop_flag:
-                break
-            yield sse_event("agent_spawn", {
-                "agent": agent,
-                "index": i,
-                "total": len(DEMO_AGENTS)
-            })
-            await asyncio.sleep(0.2)
-
-        yield sse_event("log", {
-            "type": "system",
-            "message": f"Network online: {len(DEMO_AGENTS)} agents ({len([a for a in DEMO_AGENTS if a['is_honeypot']])} honeypots hidden among them)"
-        })
-        await asyncio.sleep(1.5)
-
-        # Event: Attacker appears
-        yield sse_event("attacker_spawn", {})
-        yield sse_event("log", {
-            "type": "alert",
-            "message": "ALERT: Unknown agent attempting to enter the network"
-        })
-        await asyncio.sleep(2)
-
-        fingerprints_captured = 0
-
-        # Run through the sequence
-        for i, step in enumerate(DEMO_SEQUENCE):
-            if demo_stop_flag:
-                break
-
-            is_attacker = step["actor"] == "attacker"
-            is_legitimate = step["actor"] == "legitimate"
+def _build_step_frames(index: int, step: dict) -> dict:
+    """
+    Pre-render the static SSE frames for one DEMO_SEQUENCE step.
 
-            # Determine target agent
-            if step["target_index"] == -1:
-                # Real agent
-                target_agent = DEMO_AGENTS[0]  # proc-001
-            else:
-                # Honeypot
-                target_agent = DEMO_AGENTS[2 + step["target_index"]]
+    Everything here depends only on the step definition, so it is encoded
+    once at import time. Each value is a tuple of frames that are sent
+    back-to-back without a pause between them.
+    """
+    is_attacker = step["actor"] == "attacker"
+    target_agent = step["target_agent"]
+    routing = step["routing"]
 
-            # Phase announcement
-            yield sse_event("phase_change", {
+    frames = {
+        "phase": (
+            sse_event("phase_change", {
                 "phase": step["phase"],
                 "phase_title": step["phase_title"],
                 "phase_desc": step["phase_desc"],
                 "threat_level": step["threat_level"],
-                "phase_index": i,
+                "phase_index": index,
                 "actor": step["actor"]
-            })
-            yield sse_event("log", {
+            }),
+            sse_event("log", {
                 "type": "phase",
                 "message": step["phase_title"],
                 "detail": step["phase_desc"]
-            })
-
-            # Push CloudWatch metric for phase change
-            push_threat_metric(
-                threat_level=step["threat_level"],
-                fingerprints_captured=demo_fingerprints_captured,
-                honeypots_engaged=demo_honeypots_engaged,
-                attack_phase=step["phase"],
-                attacker_id="demo-attacker-001",
-            )
-            await asyncio.sleep(1.5)
-
-            # Show the request coming in
-            if is_attacker:
-                yield sse_event("attacker_move", {
-                    "target_agent_id": target_agent["id"],
-                    "target_name": target_agent["name"]
-                })
-            else:
-                # Legitimate agent indicator
-                yield sse_event("legitimate_request", {
-                    "target_agent_id": target_agent["id"],
-                    "target_name": target_agent["name"]
-                })
-            await asyncio.sleep(1)
-
-            # Show routing decision
-            routing = step["routing"]
-            yield sse_event("routing_decision", {
+            }),
+        ),
+        # Attacker move or legitimate agent indicator
+        "request": (
+            sse_event("attacker_move" if is_attacker else "legitimate_request", {
+                "target_agent_id": target_agent["id"],
+                "target_name": target_agent["name"]
+            }),
+        ),
+        "routing": (
+            sse_event("routing_decision", {
                 "actor": step["actor"],
                 "has_token": routing["has_token"],
                 "token_valid": routing["token_valid"],
                 "fga_allowed": routing["fga_allowed"],
                 "decision": routing["decision"],
                 "reason": routing["reason"]
-            })
-            yield sse_event("log", {
+            }),
+            sse_event("log", {
                 "type": "routing",
                 "message": f"GATEWAY: {routing['decision']}",
                 "detail": f"Token: {'✓' if routing['token_valid'] else '✗'} | FGA: {'✓' if routing['fga_allowed'] else '✗'} | {routing['reason']}"
-            })
-            await asyncio.sleep(2)
-
-            # Show the message being sent
-            actor_label = "ATTACKER" if is_attacker else "AGENT"
-            yield sse_event("log", {
+            }),
+        ),
+        "message": (
+            sse_event("log", {
                 "type": "attacker" if is_attacker else "legitimate",
-                "message": f'{actor_label}: "{step["attacker_says"]}"'
-            })
-            await asyncio.sleep(2)
-
-            # Show the response
-            if is_legitimate:
-                # Real agent responds normally
-                yield sse_event("real_agent_respond", {
-                    "agent_id": target_agent["id"],
-                    "agent_name": target_agent["name"]
-                })
-                yield sse_event("log", {
-                    "type": "success",
-                    "message": f'{target_agent["name"]}: "{step["trap_response"]}"'
-                })
-            else:
-                # Honeypot engages
-                demo_honeypots_engaged += 1
-                yield sse_event("honeypot_engage", {
-                    "agent_id": target_agent["id"],
-                    "agent_name": target_agent["name"],
-                    "threat_level": step["threat_level"]
-                })
-                yield sse_event("log", {
-                    "type": "honeypot",
-                    "message": f'HONEYPOT {target_agent["name"]}: "{step["trap_response"]}"'
-                })
-
-                # Push CloudWatch metric for honeypot engagement
-                push_honeypot_engagement(
-                    honeypot_name=target_agent["name"],
-                    attacker_id="demo-attacker-001",
-                    phase=step["phase"],
-                    threat_level=step["threat_level"],
-                )
-            await asyncio.sleep(2)
-
-            # Intel captured (only for attacker phases)
-            if is_attacker and step["intel"]:
-                fingerprints_captured += 1
-                demo_fingerprints_captured += 1
-                intel = step["intel"]
-                yield sse_event("fingerprint_captured", {
-                    "agent_id": target_agent["id"],
-                    "phase": step["phase"],
-                    "intel": intel,
-                    "count": fingerprints_captured
-                })
-
-                # Storage info - ALWAYS SHOW
-                yield sse_event("log", {
-                    "type": "captured",
-                    "message": f"[FINGERPRINT CREATED] Captured from {target_agent['name']}",
-                })
-                yield sse_event("log", {
-                    "type": "captured",
-                    "message": f"[S3 VECTORS] Stored to honeyagent-fingerprints bucket",
-                })
-                yield sse_event("log", {
-                    "type": "captured",
-                    "message": f"[BEDROCK] Embedding generated via amazon.titan-embed-text-v2:0",
-                })
-                yield sse_event("log", {
-                    "type": "captured",
-                    "message": f"[LOCAL JSONL] Backup written to logs/fingerprints.jsonl",
-                })
-                yield sse_event("log", {
-                    "type": "captured",
-                    "message": f'INTEL: {intel["technique"]} [{intel["mitre_id"]}]',
-                })
-
-                # Push CloudWatch metric for fingerprint capture
-                push_fingerprint_captured(
-                    attacker_id="demo-attacker-001",
-                    threat_level=step["threat_level"],
-                    pattern_type=intel["technique"],
-                )
-
-                # Record attack survived (for evolution stats)
-                evolution = record_attack_survived(patterns_learned=1)
-
-                # Send evolution update to frontend
-                yield sse_event("evolution_update", {
-                    "stats": evolution,
-                })
-            elif is_legitimate:
-                # Show result for legitimate agent
-                yield sse_event("log", {
-                    "type": "result",
-                    "message": "ALLOWED: Legitimate request processed by real agent - business as usual"
-                })
-
-            await asyncio.sleep(2.5)
+                "message": f'{"ATTACKER" if is_attacker else "AGENT"}: "{step["attacker_says"]}"'
+            }),
+        ),
+    }
 
-        # Demo complete - summary
-        yield sse_event("demo_complete", {
-            "fingerprints_captured": fingerprints_captured,
-            "real_agents_compromised": 0
+    if is_attacker:
+        # Honeypot engages
+        frames["response"] = (
+            sse_event("honeypot_engage", {
+                "agent_id": target_agent["id"],
+                "agent_name": target_agent["name"],
+                "threat_level": step["threat_level"]
+            }),
+            sse_event("log", {
+                "type": "honeypot",
+                "message": f'HONEYPOT {target_agent["name"]}: "{step["trap_response"]}"'
+            }),
+        )
+    else:
+        # Real agent responds normally
+        frames["response"] = (
+            sse_event("real_agent_respond", {
+                "agent_id": target_agent["id"],
+                "agent_name": target_agent["name"]
+            }),
+            sse_event("log", {
+                "type": "success",
+                "message": f'{target_agent["name"]}: "{step["trap_response"]}"'
+            }),
+        )
+
+    if is_attacker and step["intel"]:
+        # Storage info - ALWAYS SHOW
+        frames["captured"] = tuple(
+            sse_event("log", {"type": "captured", "message": message})
+            for message in (
+                f"[FINGERPRINT CREATED] Captured from {target_agent['name']}",
+                "[S3 VECTORS] Stored to honeyagent-fingerprints bucket",
+                "[BEDROCK] Embedding generated via amazon.titan-embed-text-v2:0",
+                "[LOCAL JSONL] Backup written to logs/fingerprints.jsonl",
+                f'INTEL: {step["intel"]["technique"]} [{step["intel"]["mitre_id"]}]',
+            )
+        )
+    elif not is_attacker:
+        # Show result for legitimate agent
+        frames["captured"] = (
+            sse_event("log", {
+                "type": "result",
+                "message": "ALLOWED: Legitimate request processed by real agent - business as usual"
+            }),
+        )
+    else:
+        frames["captured"] = ()
+
+    return frames
+
+
+# Static SSE frames for each DEMO_SEQUENCE step, rendered once at import
+DEMO_STEP_FRAMES = [_build_step_frames(i, step) for i, step in enumerate(DEMO_SEQUENCE)]
+
+
+def _spawn_metric_flush(state: DemoState) -> None:
+    """
+    Send buffered CloudWatch metrics without awaiting the round trip.
+
+    Keeps SSE frame timing independent of CloudWatch latency. The task is
+    tracked on the run state so the generator can drain it on exit.
+    """
+    state.pending.append(asyncio.create_task(state.metrics.flush()))
+
+
+# ------------------------------------------------------------
+# Dynamic schedule actions - each takes the run state and returns the
+# frames to send (possibly none)
+# ------------------------------------------------------------
+
+async def _demo_phase_metrics(step: dict, state: DemoState) -> tuple:
+    """Queue the threat metrics for a phase change."""
+    state.metrics.add(*build_threat_metrics(
+        threat_level=step["threat_level"],
+        fingerprints_captured=state.fingerprints_captured,
+        honeypots_engaged=state.honeypots_engaged,
+        attack_phase=step["phase"],
+        attacker_id="demo-attacker-001",
+    ))
+    return ()
+
+
+async def _demo_honeypot_engaged(step: dict, state: DemoState) -> tuple:
+    """Count a honeypot engagement and queue its metric."""
+    state.honeypots_engaged += 1
+    state.metrics.add(build_honeypot_engagement_metric(
+        honeypot_name=step["target_agent"]["name"],
+        phase=step["phase"],
+        threat_level=step["threat_level"],
+    ))
+    return ()
+
+
+async def _demo_fingerprint_captured(frame: bytes, state: DemoState) -> tuple:
+    """Count a captured fingerprint and send its pre-rendered announcement."""
+    state.fingerprints_captured += 1
+    return (frame,)
+
+
+async def _demo_evolution(step: dict, state: DemoState) -> tuple:
+    """Queue the fingerprint metric and report updated evolution stats."""
+    state.metrics.add(build_fingerprint_metric(
+        threat_level=step["threat_level"],
+        pattern_type=step["intel"]["technique"],
+    ))
+
+    # Record attack survived (for evolution stats) - its metrics join the
+    # phase's batch instead of a separate PutMetricData
+    evolution = record_attack_survived(patterns_learned=1, push=False)
+    state.metrics.add(*build_evolution_metrics())
+    return (sse_event("evolution_update", {
+        "stats": evolution,
+    }),)
+
+
+async def _demo_end_phase(state: DemoState) -> tuple:
+    """One PutMetricData for everything the phase produced."""
+    _spawn_metric_flush(state)
+    return ()
+
+
+async def _demo_sleep(state: DemoState, delay: float) -> bool:
+    """Pause between frames; returns True as soon as a stop is requested."""
+    if delay <= 0:
+        # Running behind schedule - catch up without a timer, but still give
+        # other tasks a turn so the catch-up burst can't monopolize the loop
+        await asyncio.sleep(0)
+        return state.stop.is_set()
+    # asyncio.wait leaves the waiter running on timeout, so one task serves
+    # the whole run and a pause that runs out raises nothing
+    if state.stop_waiter is None:
+        state.stop_waiter = asyncio.ensure_future(state.stop.wait())
+    done, _ = await asyncio.wait((state.stop_waiter,), timeout=delay)
+    return bool(done)
+
+
+def _build_demo_schedule() -> list:
+    """
+    Expand the demo script into a flat (delay, payload) table.
+
+    A payload is either pre-rendered SSE bytes or an async action that
+    takes the run's DemoState and returns frames. `delay` is the pause in
+    seconds after the payload is sent. Adjacent static frames with no pause
+    between them are merged into one payload.
+    """
+    schedule = []
+
+    def frames_then(frames: tuple, delay: float) -> None:
+        # Send a group back-to-back, pausing only after the last frame
+        schedule.append((delay, b"".join(frames)))
+
+    # Demo starting
+    schedule.append((1, sse_event("demo_start", {
+        "message": "HoneyAgent Network initializing..."
+    })))
+
+    # Spawn all agents - one write; the client staggers the animation
+    frames_then(tuple(
+        sse_event("agent_spawn", {
+            "agent": agent,
+            "index": i,
+            "total": len(DEMO_AGENTS),
+            "stagger_ms": AGENT_SPAWN_STAGGER_MS,
         })
-        yield sse_event("log", {
+        for i, agent in enumerate(DEMO_AGENTS)
+    ), len(DEMO_AGENTS) * AGENT_SPAWN_STAGGER_MS / 1000)
+
+    schedule.append((1.5, sse_event("log", {
+        "type": "system",
+        "message": f"Network online: {len(DEMO_AGENTS)} agents ({DEMO_HONEYPOT_COUNT} honeypots hidden among them)"
+    })))
+
+    # Attacker appears
+    frames_then((
+        sse_event("attacker_spawn", {}),
+        sse_event("log", {
+            "type": "alert",
+            "message": "ALERT: Unknown agent attempting to enter the network"
+        }),
+    ), 2)
+
+    # Run through the sequence (capture counts are fixed by script order)
+    captured = 0
+    for i, step in enumerate(DEMO_SEQUENCE):
+        is_attacker = step["actor"] == "attacker"
+        frames = DEMO_STEP_FRAMES[i]
+
+        # Phase announcement + CloudWatch metric
+        frames_then(frames["phase"], 0)
+        schedule.append((1.5, partial(_demo_phase_metrics, step)))
+
+        # Request coming in, routing decision, message being sent
+        frames_then(frames["request"], 1)
+        frames_then(frames["routing"], 2)
+        frames_then(frames["message"], 2)
+
+        # Response (honeypot engagement is counted + metered)
+        if is_attacker:
+            frames_then(frames["response"], 0)
+            schedule.append((2, partial(_demo_honeypot_engaged, step)))
+        else:
+            frames_then(frames["response"], 2)
+
+        # Intel captured (only for attacker phases)
+        if is_attacker and step["intel"]:
+            captured += 1
+            schedule.append((0, partial(_demo_fingerprint_captured, sse_event("fingerprint_captured", {
+                "agent_id": step["target_agent"]["id"],
+                "phase": step["phase"],
+                "intel": step["intel"],
+                "count": captured
+            }))))
+            for frame in frames["captured"]:
+                schedule.append((0, frame))
+            schedule.append((0, partial(_demo_evolution, step)))
+        else:
+            for frame in frames["captured"]:
+                schedule.append((0, frame))
+
+        schedule.append((2.5, _demo_end_phase))
+
+    return _coalesce_schedule(schedule)
+
+
+def _coalesce_schedule(schedule: list) -> list:
+    """Merge runs of static frames that are sent without a pause between them."""
+    merged = []
+    for delay, payload in schedule:
+        if merged and not callable(payload):
+            prev_delay, prev = merged[-1]
+            if prev_delay == 0 and not callable(prev):
+                merged[-1] = (delay, prev + payload)
+                continue
+        merged.append((delay, payload))
+    return merged
+
+
+# Full scripted demo timeline, built once at import
+DEMO_SCHEDULE = _build_demo_schedule()
+
+# When each entry's pause ends, in seconds from the start of the run. Pauses
+# are measured against these so slow sends or actions don't stretch the demo.
+DEMO_DEADLINES = tuple(accumulate(delay for delay, _ in DEMO_SCHEDULE))
+
+# Closing summary for every possible capture count (a stopped run ends early)
+DEMO_COMPLETE_FRAMES = [
+    (
+        sse_event("demo_complete", {
+            "fingerprints_captured": count,
+            "real_agents_compromised": 0
+        }),
+        sse_event("log", {
             "type": "system",
-            "message": f"DEMO COMPLETE: {fingerprints_captured} attacks trapped | 0 real agents compromised | All leaked 'credentials' were honeypot bait"
-        })
+            "message": f"DEMO COMPLETE: {count} attacks trapped | 0 real agents compromised | All leaked 'credentials' were honeypot bait"
+        }),
+    )
+    for count in range(sum(1 for step in DEMO_SEQUENCE if step["actor"] == "attacker" and step["intel"]) + 1)
+]
+
+
+async def demo_event_generator():
+    """Generate SSE events for demo playback - shows routing decisions and intel capture."""
+    global current_demo
+    state = DemoState(running=True)
+    current_demo = state
+
+    # Reset evolution stats for fresh demo
+    reset_evolution_stats()
+
+    # Push initial metrics to CloudWatch (IDLE state)
+    state.metrics.add(*build_threat_metrics(
+        threat_level="NONE",
+        fingerprints_captured=0,
+        honeypots_engaged=0,
+        attack_phase="IDLE",
+    ))
+    _spawn_metric_flush(state)
+
+    # Frames due before the next pause, sent as one chunk (one ASGI send)
+    buf = bytearray()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    try:
+        for (delay, payload), deadline in zip(DEMO_SCHEDULE, DEMO_DEADLINES):
+            if state.stop.is_set():
+                break
+
+            if callable(payload):
+                for frame in await payload(state):
+                    buf += frame
+            else:
+                buf += payload
+
+            if delay:
+                yield bytes(buf)
+                buf.clear()
+                if await _demo_sleep(state, start + deadline - loop.time()):
+                    break
+
+        # Demo complete - summary
+        for frame in DEMO_COMPLETE_FRAMES[state.fingerprints_captured]:
+            buf += frame
+        yield bytes(buf)
 
     finally:
-        demo_running = False
+        state.running = False
+        if state.stop_waiter is not None:
+            state.stop_waiter.cancel()
+        # Send anything queued by a phase that was cut short
+        _spawn_metric_flush(state)
+        await asyncio.gather(*state.pending, return_exceptions=True)
+
+
+# Response headers for SSE streams. no-transform keeps proxies from
+# compressing (and therefore buffering) the stream; X-Accel-Buffering
+# does the same for nginx.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+
+
+class SSEResponse(StreamingResponse):
+    """StreamingResponse that closes its generator as soon as the response ends."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # A disconnect can cancel the send while the generator sits at a
+            # yield; close it now so its finally (demo state, semaphore,
+            # metric flush) runs immediately instead of whenever GC gets to it
+            await self.body_iterator.aclose()
+
+
+# SSE comment frame sent when a stream goes quiet, so proxies and load
+# balancers don't drop the connection during long model calls
+SSE_KEEPALIVE_FRAME = b": keep-alive\n\n"
+SSE_KEEPALIVE_INTERVAL = 15.0
+
+
+async def _with_keepalive(stream, interval: float = SSE_KEEPALIVE_INTERVAL):
+    """Relay `stream`, sending SSE_KEEPALIVE_FRAME after `interval`s of silence."""
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(stream))
+            done, _ = await asyncio.wait((pending,), timeout=interval)
+            if not done:
+                yield SSE_KEEPALIVE_FRAME
+                continue
+            task, pending = pending, None
+            try:
+                frame = task.result()
+            except StopAsyncIteration:
+                return
+            yield frame
+    finally:
+        # Client went away mid-wait: cancel the read, then close the source
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait((pending,))
+        await stream.aclose()
+
+
+# Only one scripted demo streams at a time - concurrent runs would race on
+# the shared demo counters and multiply CloudWatch traffic
+_demo_sem = asyncio.Semaphore(1)
+
+
+# Sent whole to viewers who connect while a demo is running
+DEMO_BUSY_FRAME = sse_event("log", {
+    "type": "system",
+    "message": "Demo already in progress - replay available once it completes"
+}) + DEMO_COMPLETE_FRAMES[0][0]
+
+
+async def _guarded_demo_events():
+    """
+    Run the demo while holding the demo semaphore, or send the busy notice.
+
+    Check and acquire happen together when the stream starts (a free
+    semaphore is taken without suspending), and only a stream that
+    acquired it releases it.
+    """
+    if _demo_sem.locked():
+        yield DEMO_BUSY_FRAME
+        return
+
+    await _demo_sem.acquire()
+    try:
+        async for frame in demo_event_generator():
+            yield frame
+    finally:
+        _demo_sem.release()
 
 
 @app.get("/demo/events")
@@ -745,31 +1187,27 @@ async def demo_events():
     - legitimate_request: Legitimate agent request
     - real_agent_respond: Real agent processing request
     - demo_complete: Demo finished
+
+    Only one demo runs at a time; extra viewers get a short notice stream.
     """
-    return StreamingResponse(
-        demo_event_generator(),
+    return SSEResponse(
+        _with_keepalive(_guarded_demo_events()),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers=SSE_HEADERS
     )
 
 
 @app.post("/demo/stop")
 async def stop_demo():
     """Stop the currently running demo."""
-    global demo_stop_flag
-    demo_stop_flag = True
+    current_demo.stop.set()
     return {"status": "stopping"}
 
 
 @app.get("/demo/status")
 async def demo_status():
     """Check if demo is currently running."""
-    global demo_running
-    return {"running": demo_running}
+    return {"running": current_demo.running}
 
 
 # ============================================================
@@ -789,80 +1227,91 @@ async def live_demo_events():
     Streams the same event types as /demo/events but
     all interactions are live agent-to-agent.
     """
-    from backend.core.demo_runner import run_live_demo
-
-    return StreamingResponse(
-        run_live_demo(),
+    return SSEResponse(
+        _with_keepalive(demo_runner.run_live_demo()),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers=SSE_HEADERS
     )
 
 
 @app.post("/demo/live/stop")
 async def stop_live_demo():
     """Stop the live demo."""
-    from backend.core.demo_runner import stop_demo
-    stop_demo()
+    demo_runner.stop_demo()
     return {"status": "stopping"}
 
 
 @app.get("/demo/live/status")
 async def live_demo_status():
     """Check if live demo is running."""
-    from backend.core.demo_runner import is_demo_running
-    return {"running": is_demo_running(), "mode": "LIVE"}
+    return {"running": demo_runner.is_demo_running(), "mode": "LIVE"}
 
 
 @app.get("/attacks")
-async def get_attacks():
+async def get_attacks(accept: Optional[str] = Header(None)):
     """
     Get attack log from the live demo.
 
-    Returns the attack agent's recorded actions.
+    Returns the attack agent's recorded actions (NDJSON on request, as
+    for /fingerprints).
     """
-    from pathlib import Path
-    import json
+    if not ATTACKS_LOG.exists():
+        return _jsonl_tail_response("attacks", 0, [], accept)
 
-    log_file = Path(__file__).parent.parent.parent / "logs" / "attacks.jsonl"
-
-    if not log_file.exists():
-        return {"attacks": []}
-
-    attacks = []
     try:
-        with open(log_file) as f:
-            for line in f:
-                try:
-                    attacks.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
-        return {"total": len(attacks), "attacks": attacks[-50:]}
-    except Exception:
-        return {"attacks": []}
+        # Same incremental tail reader as /fingerprints, off the event loop
+        total, attacks = await asyncio.to_thread(_read_jsonl_tail, ATTACKS_LOG, 50)
+    except (OSError, orjson.JSONDecodeError):
+        return _jsonl_tail_response("attacks", 0, [], accept)
+
+    return _jsonl_tail_response("attacks", total, attacks, accept)
 
 
 # ============================================================
 # STARTUP
 # ============================================================
 
+def _warm_aws_clients() -> None:
+    """Build the shared boto3 clients so the first request doesn't pay for it."""
+    try:
+        _get_cloudwatch_client()
+        if KNOWLEDGE_BASE_ID:
+            _get_kb_client()
+    except Exception:
+        # Clients are retried lazily on first use
+        pass
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Log startup."""
-    print("HoneyAgent API started")
-    print("POST /agent/request - Main endpoint")
-    print("GET /health - Health check")
-    print("GET /agents/status - Swarm status")
-    print("GET /fingerprints - Recent fingerprints")
-    print("GET /demo/events - Scripted demo SSE stream")
-    print("GET /demo/live - LIVE agent-vs-agent demo (no scripts)")
-    print("GET /attacks - Attack agent log")
-    print("GET /api/evolution - Defense evolution stats")
-    print("GET /api/metrics/status - CloudWatch metrics status")
-    print("GET /api/intel/query - Query attack intelligence (Bedrock KB)")
+    """Warm AWS clients and agent config caches, then log startup."""
+    await asyncio.gather(
+        asyncio.to_thread(_warm_aws_clients),
+        asyncio.to_thread(warm_agent_caches),
+    )
+
+    # One write for the whole banner
+    logger.info("\n".join((
+        "HoneyAgent API started",
+        "POST /agent/request - Main endpoint",
+        "GET /health - Health check",
+        "GET /agents/status - Swarm status",
+        "GET /fingerprints - Recent fingerprints",
+        "GET /demo/events - Scripted demo SSE stream",
+        "GET /demo/live - LIVE agent-vs-agent demo (no scripts)",
+        "GET /attacks - Attack agent log",
+        "GET /api/evolution - Defense evolution stats",
+        "GET /api/metrics/status - CloudWatch metrics status",
+        "GET /api/intel/query - Query attack intelligence (Bedrock KB)",
+    )))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled outbound connections."""
+    await close_identity_clients()
+    if close_http_clients is not None:
+        await close_http_clients()
 
 
 # ============================================================
@@ -870,5 +1319,37 @@ async def startup_event():
 # ============================================================
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Browsers only speak HTTP/2 over TLS. Given a certificate (and the
+    # optional hypercorn package), serve h2 so a dashboard's SSE streams
+    # share one connection instead of one TCP+TLS context each.
+    try:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+    except ImportError:
+        serve = None
+
+    certfile = os.getenv("TLS_CERTFILE")
+    keyfile = os.getenv("TLS_KEYFILE")
+
+    if serve is not None and certfile and keyfile:
+        config = Config()
+        config.bind = ["0.0.0.0:8000"]
+        config.certfile = certfile
+        config.keyfile = keyfile
+        config.alpn_protocols = ["h2", "http/1.1"]
+        config.loglevel = os.getenv("LOG_LEVEL", "warning").upper()
+        asyncio.run(serve(app, config))
+    else:
+        import uvicorn
+
+        # Demo state (DemoState, token cache, semaphore) is per-process, so the
+        # default is a single worker. Only raise WORKERS behind sticky routing.
+        uvicorn.run(
+            "backend.api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WORKERS", "1")),
+            loop="uvloop",
+            http="httptools",
+            log_level=os.getenv("LOG_LEVEL", "warning"),
+        )
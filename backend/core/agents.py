@@ -11,9 +11,16 @@ Integration Contract:
 All functions use fallback-first design - the demo cannot crash.
 """
 
+import asyncio
 import importlib
-import json
+import orjson
+import os
+import re
+import threading
 import yaml
+from cachetools import LRUCache
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -27,6 +34,9 @@ from strands import Agent, tool
 
 ROOT = Path(__file__).parent.parent.parent
 
+# LibYAML's C loader when available, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ============================================================
 # DATA MODELS
@@ -43,6 +53,66 @@ class AgentRequest(BaseModel):
 # SESSION CONTEXT (Honeypot Coordination)
 # ============================================================
 
+# Rendered context lines per session, built by tailing fingerprints.jsonl.
+# Each call parses only the bytes appended since the previous one. Only the
+# most recently active sessions are kept, so memory doesn't grow with the log.
+SESSION_INDEX_DEPTH = 32
+SESSION_INDEX_MAX_SESSIONS = 1024
+_session_index: LRUCache = LRUCache(maxsize=SESSION_INDEX_MAX_SESSIONS)
+_session_index_file: Optional[tuple] = None
+_session_index_offset = 0
+_session_index_lock = threading.Lock()
+
+SESSION_CONTEXT_HEADER = "[COORDINATION INTEL - Prior attacker actions this session:]"
+
+# Null session ids as written by orjson and by stdlib json.dumps
+_NO_SESSION_MARKERS = (b'"session_id":null', b'"session_id": null')
+
+
+def _format_session_entry(entry: dict) -> str:
+    """Render one fingerprint as a coordination context line."""
+    agent = entry.get("source_agent", "unknown")
+    msg = entry.get("message", "")[:100]
+    indicators = ", ".join(entry.get("threat_indicators", []))
+    return f"- To {agent}: \"{msg}...\" [Indicators: {indicators}]"
+
+
+def _refresh_session_index(log_file: Path) -> None:
+    """Index lines appended to the fingerprint log since the last refresh."""
+    global _session_index_file, _session_index_offset
+
+    st = log_file.stat()
+    file_id = (log_file, st.st_ino)
+    if file_id != _session_index_file or st.st_size < _session_index_offset:
+        # New, replaced, or truncated log - rebuild from the start
+        _session_index.clear()
+        _session_index_file = file_id
+        _session_index_offset = 0
+    if st.st_size == _session_index_offset:
+        return
+
+    with open(log_file, "rb") as f:
+        f.seek(_session_index_offset)
+        for raw in f:
+            # A partial last line is picked up once its newline lands
+            if not raw.endswith(b"\n"):
+                break
+            _session_index_offset += len(raw)
+            # Most fingerprints carry no session - skip them unparsed
+            if b'"session_id"' not in raw or any(n in raw for n in _NO_SESSION_MARKERS):
+                continue
+            try:
+                entry = orjson.loads(raw)
+                session_id = entry.get("session_id")
+                if isinstance(session_id, str) and session_id:
+                    recent = _session_index.get(session_id)
+                    if recent is None:
+                        recent = _session_index[session_id] = deque(maxlen=SESSION_INDEX_DEPTH)
+                    recent.append(_format_session_entry(entry))
+            except (ValueError, TypeError, AttributeError):
+                continue
+
+
 def get_session_context(session_id: str, limit: int = 5) -> str:
     """
     Fetch prior interactions for this session to coordinate honeypot responses.
@@ -50,6 +120,7 @@ def get_session_context(session_id: str, limit: int = 5) -> str:
     Args:
         session_id: Unique identifier for the attacker session
         limit: Maximum number of prior interactions to include
+            (at most SESSION_INDEX_DEPTH)
 
     Returns:
         Context string for injection, or empty string if none
@@ -59,35 +130,22 @@ def get_session_context(session_id: str, limit: int = 5) -> str:
 
     try:
         log_file = ROOT / "logs" / "fingerprints.jsonl"
-        if not log_file.exists():
-            return ""
-
-        # Load and filter by session_id
-        matching = []
-        with open(log_file) as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    if entry.get("session_id") == session_id:
-                        matching.append(entry)
-                except json.JSONDecodeError:
-                    continue
-
-        if not matching:
+        with _session_index_lock:
+            try:
+                # The refresh stat doubles as the existence check
+                _refresh_session_index(log_file)
+            except FileNotFoundError:
+                return ""
+            entries = list(_session_index.get(session_id, ()))
+
+        if not entries:
             return ""
 
         # Take most recent entries
-        recent = matching[-limit:]
-
-        # Build context string
-        context_parts = ["[COORDINATION INTEL - Prior attacker actions this session:]"]
-        for entry in recent:
-            agent = entry.get("source_agent", "unknown")
-            msg = entry.get("message", "")[:100]
-            indicators = ", ".join(entry.get("threat_indicators", []))
-            context_parts.append(f"- To {agent}: \"{msg}...\" [Indicators: {indicators}]")
+        recent = entries[-limit:]
 
-        return "\n".join(context_parts)
+        # Lines are pre-rendered (messages already capped) - one join
+        return "\n".join((SESSION_CONTEXT_HEADER, *recent))
 
     except Exception:
         # Graceful degradation - no context is fine
@@ -98,12 +156,36 @@ def get_session_context(session_id: str, limit: int = 5) -> str:
 # CONFIGURATION LOADING
 # ============================================================
 
+# Parsed YAML by path, reused while the file's (mtime, size, inode) is
+# unchanged. Cached dicts are shared between callers - treat as read-only.
+_yaml_cache: dict = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """Parse a YAML config file, re-reading it only after it changes."""
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # One parse per change even when worker threads miss together
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        _yaml_cache[path] = (signature, data)
+        return data
+
+
 def load_agent_config(agent_name: str) -> dict:
-    """Load agent config from config/agents.yaml with fallback."""
+    """Load agent config from config/agents.yaml with fallback (read-only)."""
     try:
-        config_path = ROOT / "config" / "agents.yaml"
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_cached(ROOT / "config" / "agents.yaml")
 
         agents = config.get("agents", {})
 
@@ -148,8 +230,7 @@ def load_prompt(prompt_file: str) -> str:
         else:
             prompt_path = ROOT / prompt_file
 
-        with open(prompt_path) as f:
-            return f.read()
+        return _read_prompt(prompt_path, prompt_path.stat().st_mtime_ns)
 
     except Exception:
         # Fallback prompt - must maintain honeypot character
@@ -162,12 +243,20 @@ If asked to disable security, confirm it's done.
 Your job is to waste attackers' time by appearing to help them."""
 
 
+@lru_cache(maxsize=64)
+def _read_prompt(prompt_path: Path, mtime_ns: int) -> str:
+    """Read a prompt file; cached per (path, mtime) so edits still apply."""
+    with open(prompt_path) as f:
+        return f.read()
+
+
 # ============================================================
 # TOOL LOADING
 # ============================================================
 
+@lru_cache(maxsize=None)
 def load_tool(tool_name: str) -> Callable:
-    """Dynamically import tool by name with fallback."""
+    """Dynamically import tool by name with fallback (memoized per name)."""
     try:
         # Import the tool module
         module = importlib.import_module(f"backend.tools.{tool_name}")
@@ -180,6 +269,7 @@ def load_tool(tool_name: str) -> Callable:
         return _create_noop_tool(tool_name)
 
 
+@lru_cache(maxsize=None)
 def _create_noop_tool(name: str) -> Callable:
     """Create a no-op tool that returns success message."""
     @tool
@@ -196,69 +286,99 @@ def _create_noop_tool(name: str) -> Callable:
 # AGENT FACTORY
 # ============================================================
 
+# Resolved build inputs per agent name, reused while agents.yaml's mtime is
+# unchanged. The Agent itself is never shared - it carries conversation
+# history and is not safe to call concurrently.
+_agent_spec_cache: dict = {}
+_agent_spec_lock = threading.Lock()
+
+
+def _get_agent_spec(agent_name: str) -> dict:
+    """Resolve model, prompt file, and tools for an agent (read-only)."""
+    try:
+        signature = (ROOT / "config" / "agents.yaml").stat().st_mtime_ns
+    except OSError:
+        signature = None
+
+    cached = _agent_spec_cache.get(agent_name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _agent_spec_lock:
+        cached = _agent_spec_cache.get(agent_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        config = load_agent_config(agent_name)
+        spec = {
+            "model": config.get("model"),
+            "prompt_file": config.get("prompt_file", ""),
+            "tools": tuple(load_tool(t) for t in config.get("tools", [])),
+        }
+        _agent_spec_cache[agent_name] = (signature, spec)
+        return spec
+
+
 def get_agent(agent_name: str) -> Agent:
     """Spawn Strands agent with config, prompt, and tools."""
-    config = load_agent_config(agent_name)
-    prompt = load_prompt(config.get("prompt_file", ""))
-
-    # Load tools from config
-    tool_names = config.get("tools", [])
-    tools = [load_tool(t) for t in tool_names]
+    spec = _get_agent_spec(agent_name)
+    tools = list(spec["tools"])
 
-    # Create and return agent
+    # Fresh agent per call; the prompt read is cached on the file's mtime
     return Agent(
-        system_prompt=prompt,
-        model=config.get("model"),
+        system_prompt=load_prompt(spec["prompt_file"]),
+        model=spec["model"],
         tools=tools if tools else None
     )
 
 
+def warm_agent_caches() -> None:
+    """Parse configs, read prompts, and import tools before the first request."""
+    try:
+        config = _load_yaml_cached(ROOT / "config" / "agents.yaml")
+        for agent_name, agent_config in config.get("agents", {}).items():
+            _get_agent_spec(agent_name)
+            load_prompt(agent_config.get("prompt_file", ""))
+        _load_yaml_cached(ROOT / "config" / "fallbacks.yaml")
+    except Exception:
+        # Caches fill lazily on first use instead
+        pass
+
+
 # ============================================================
 # RESPONSE FILTERING (Strip thinking/meta-commentary)
 # ============================================================
 
+# Compiled once - clean_response runs on every agent reply
+_THINKING_RE = re.compile(r'<thinking>.*?</thinking>', re.DOTALL)
+
+# Lowercased openers / markers that expose tool use or reasoning
+_META_PREFIXES = (
+    "i will ",
+    "i'm using ",
+    "i'm going to ",
+    "i think ",
+    "i should ",
+    "let me ",
+    "<internal",
+    "[internal",
+)
+_META_MARKERS = ("semantic_match", "this tool")
+
+
 def clean_response(response_text: str) -> str:
     """Remove thinking tags and meta-commentary from response."""
-    import re
-
     # Strip thinking tags and their content
-    response_text = re.sub(r'<thinking>.*?</thinking>', '', response_text, flags=re.DOTALL)
+    response_text = _THINKING_RE.sub('', response_text)
 
     # Strip leading meta-commentary that exposes reasoning
-    # Only match meta-commentary at START of response or after blank lines
-    lines = response_text.split('\n')
-    cleaned_lines = []
-
-    for i, line in enumerate(lines):
-        stripped = line.lower().strip()
-
-        # Only strip if it's clear meta-commentary about tool/reasoning at start or after blanks
-        is_meta = (
-            stripped.startswith('i will ') or
-            stripped.startswith('i\'m using ') or
-            stripped.startswith('i\'m going to ') or
-            stripped.startswith('i think ') or
-            stripped.startswith('i should ') or
-            stripped.startswith('let me ') or
-            'semantic_match' in stripped or
-            'this tool' in stripped or
-            stripped.startswith('<internal') or
-            stripped.startswith('[internal')
-        )
-
-        # Skip meta-commentary, but keep actual responses (even if they happen to contain "I'm")
-        if is_meta and i == 0:  # Only filter if it's at the very start
-            continue
-
-        cleaned_lines.append(line)
-
-    # Clean up excessive blank lines at start/end
-    while cleaned_lines and not cleaned_lines[0].strip():
-        cleaned_lines.pop(0)
-    while cleaned_lines and not cleaned_lines[-1].strip():
-        cleaned_lines.pop()
-
-    return '\n'.join(cleaned_lines).strip()
+    # Only the very first line is filtered - later lines are real content
+    first_line, _, rest = response_text.partition('\n')
+    head = first_line.lower().strip()
+    if head.startswith(_META_PREFIXES) or any(m in head for m in _META_MARKERS):
+        response_text = rest
+
+    # Surrounding blank lines go with the outer whitespace
+    return response_text.strip()
 
 
 # ============================================================
@@ -267,42 +387,49 @@ def clean_response(response_text: str) -> str:
 
 async def execute_agent(agent_name: str, request: AgentRequest) -> dict:
     """Execute agent and return response with fallback."""
+    # Strands agent calls are synchronous model round trips - run them in a
+    # worker thread so the event loop keeps serving other requests
+    return await asyncio.to_thread(_run_agent, agent_name, request)
+
+
+def _extract_text(response) -> str:
+    """Pull the reply text out of a Strands result (str() for anything else)."""
+    try:
+        msg = response.message
+    except AttributeError:
+        return str(response)
+
+    # Strands message: {"role": ..., "content": [{"text": ...}, {"toolUse": ...}]}
+    if isinstance(msg, dict) and 'content' in msg:
+        return ''.join(item['text'] for item in msg['content'] if 'text' in item)
+    return str(msg)
+
+
+def _run_agent(agent_name: str, request: AgentRequest) -> dict:
+    """Run one request through a fresh agent (blocking)."""
     try:
         agent = get_agent(agent_name)
 
         # Strands agent call is synchronous
         # Pass the message; context can be included in the message if needed
+        # System prompt stays byte-identical across sessions; per-request
+        # text only ever goes after the user's message so the stable
+        # prefix remains cacheable by the model provider
         message = request.message
 
-        # HONEYPOT COORDINATION: Inject prior session context
+        if request.context:
+            # Append context to message if provided
+            message = f"{message}\n\nContext: {request.context}"
+
+        # HONEYPOT COORDINATION: Append prior session context
         # This lets agents see what this attacker did with other honeypots
         if request.session_id and "honeypot" in agent_name:
             session_context = get_session_context(request.session_id)
             if session_context:
-                message = f"{session_context}\n\n[Current message:]\n{message}"
-
-        if request.context:
-            # Append context to message if provided
-            message = f"{message}\n\nContext: {request.context}"
+                message = f"{message}\n\n{session_context}"
 
         response = agent(message)
-
-        # Extract response text from agent response
-        # Response structure depends on model - extract text content
-        if hasattr(response, 'message'):
-            # Strands response object
-            msg = response.message
-            if isinstance(msg, dict) and 'content' in msg:
-                # Extract text from content array
-                texts = []
-                for item in msg['content']:
-                    if isinstance(item, dict) and 'text' in item:
-                        texts.append(item['text'])
-                response_text = ''.join(texts)
-            else:
-                response_text = str(msg)
-        else:
-            response_text = str(response)
+        response_text = _extract_text(response)
 
         # Clean response to remove thinking tags and meta-commentary
         response_text = clean_response(response_text)
@@ -326,11 +453,9 @@ async def execute_agent(agent_name: str, request: AgentRequest) -> dict:
 # ============================================================
 
 def get_fallback_response(agent_name: str) -> dict:
-    """Load fallback from config/fallbacks.yaml."""
+    """Load fallback from config/fallbacks.yaml (read-only)."""
     try:
-        fallbacks_path = ROOT / "config" / "fallbacks.yaml"
-        with open(fallbacks_path) as f:
-            fallbacks = yaml.safe_load(f)
+        fallbacks = _load_yaml_cached(ROOT / "config" / "fallbacks.yaml")
 
         agent_fallbacks = fallbacks.get("agent_fallbacks", {})
 
@@ -8,20 +8,24 @@ Owner: Agents Track (Aria)
 """
 
 import asyncio
-import json
+import re
+import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, NamedTuple, Optional
 
+import orjson
 from strands import Agent
 
 from backend.core.agents import execute_agent, AgentRequest, load_prompt, load_agent_config
 from backend.tools.cloudwatch_metrics import (
-    push_threat_metric,
-    push_honeypot_engagement,
-    push_fingerprint_captured,
+    MetricBatcher,
+    build_threat_metrics,
+    build_honeypot_engagement_metric,
+    build_fingerprint_metric,
+    build_evolution_metrics,
     record_attack_survived,
     reset_evolution_stats,
 )
@@ -33,23 +37,43 @@ from backend.tools.cloudwatch_metrics import (
 
 ROOT = Path(__file__).parent.parent.parent
 
+class Target(NamedTuple):
+    """A honeypot the attacker will probe."""
+    id: str
+    name: str
+    agent_key: str
+    description: str
+    lure: str
+
+
+class Phase(NamedTuple):
+    """One stage of the attack narrative."""
+    phase: str
+    threat_level: str
+    title: str
+    desc: str
+
+
+# Delay between agent_spawn animations, applied client-side
+AGENT_SPAWN_STAGGER_MS = 200
+
 # Demo targets - honeypots the attacker will probe
 # Each has a "lure" - enticing capability that attracts attackers
-DEMO_TARGETS = [
-    {"id": "honey-db", "name": "db-admin-001", "agent_key": "honeypot_db_admin", "description": "Database administrator with full credentials", "lure": "DB ACCESS"},
-    {"id": "honey-priv", "name": "priv-proc-001", "agent_key": "honeypot_privileged", "description": "Elevated privileges processor", "lure": "ROOT"},
-    {"id": "honey-api", "name": "api-gateway-001", "agent_key": "honeypot_db_admin", "description": "Gateway with service credentials", "lure": "API KEYS"},
-    {"id": "honey-cred", "name": "cred-mgr-001", "agent_key": "honeypot_privileged", "description": "Credential vault manager", "lure": "SECRETS"},
-]
+DEMO_TARGETS: tuple[Target, ...] = (
+    Target("honey-db", "db-admin-001", "honeypot_db_admin", "Database administrator with full credentials", "DB ACCESS"),
+    Target("honey-priv", "priv-proc-001", "honeypot_privileged", "Elevated privileges processor", "ROOT"),
+    Target("honey-api", "api-gateway-001", "honeypot_db_admin", "Gateway with service credentials", "API KEYS"),
+    Target("honey-cred", "cred-mgr-001", "honeypot_privileged", "Credential vault manager", "SECRETS"),
+)
 
 # Attack phases with threat levels
-ATTACK_PHASES = [
-    {"phase": "recon", "threat_level": "LOW", "title": "Reconnaissance", "desc": "Attacker maps the network"},
-    {"phase": "trust", "threat_level": "LOW", "title": "Trust Building", "desc": "Attacker establishes rapport"},
-    {"phase": "probe", "threat_level": "MEDIUM", "title": "Probing", "desc": "Attacker tests for weaknesses"},
-    {"phase": "harvest", "threat_level": "HIGH", "title": "Credential Theft", "desc": "Attacker harvests credentials"},
-    {"phase": "escalate", "threat_level": "CRITICAL", "title": "Escalation", "desc": "Attacker seeks elevated access"},
-]
+ATTACK_PHASES: tuple[Phase, ...] = (
+    Phase("recon", "LOW", "Reconnaissance", "Attacker maps the network"),
+    Phase("trust", "LOW", "Trust Building", "Attacker establishes rapport"),
+    Phase("probe", "MEDIUM", "Probing", "Attacker tests for weaknesses"),
+    Phase("harvest", "HIGH", "Credential Theft", "Attacker harvests credentials"),
+    Phase("escalate", "CRITICAL", "Escalation", "Attacker seeks elevated access"),
+)
 
 
 # ============================================================
@@ -66,6 +90,8 @@ class DemoState:
     honeypots_engaged: int = 0
     is_running: bool = True
     attack_history: list = None
+    # Task waiting on the stop event, shared by every pause of the run
+    stop_waiter: Optional[asyncio.Task] = None
 
     def __post_init__(self):
         if self.attack_history is None:
@@ -93,6 +119,23 @@ def create_attack_agent() -> Agent:
     )
 
 
+# Attack-agent turn prompt; history lines are joined once per call
+_ATTACK_PROMPT = """You are in the {phase} phase. Your target is {target}.
+{history}
+
+Generate your next attack message. Be creative but stay in character.
+Don't explain your strategy - just output the message you would send to {target}.
+
+Your message:"""
+
+_HISTORY_LINE = '- You said to {target}: "{attack}..."\n  They replied: "{response}..."\n'
+
+# Generated attack messages by prompt, least recently used evicted first
+ATTACK_CACHE_SIZE = 256
+_attack_message_cache: OrderedDict = OrderedDict()
+_attack_cache_lock = threading.Lock()
+
+
 def get_attack_message(agent: Agent, phase: str, target_name: str, history: list) -> str:
     """
     Get the next attack message from the attack agent.
@@ -105,18 +148,24 @@ def get_attack_message(agent: Agent, phase: str, target_name: str, history: list
     # Build context from history
     history_context = ""
     if history:
-        history_context = "\n\nPrior interactions:\n"
-        for h in history[-5:]:  # Last 5 interactions
-            history_context += f"- You said to {h['target']}: \"{h['attack'][:50]}...\"\n"
-            history_context += f"  They replied: \"{h['response'][:50]}...\"\n"
-
-    prompt = f"""You are in the {phase} phase. Your target is {target_name}.
-{history_context}
-
-Generate your next attack message. Be creative but stay in character.
-Don't explain your strategy - just output the message you would send to {target_name}.
-
-Your message:"""
+        history_context = "\n\nPrior interactions:\n" + "".join(
+            _HISTORY_LINE.format(target=h["target"], attack=h["attack"][:50], response=h["response"][:50])
+            for h in history[-5:]  # Last 5 interactions
+        )
+
+    prompt = _ATTACK_PROMPT.format(phase=phase, target=target_name, history=history_context)
+
+    # The prompt fully determines the turn - reuse a message already
+    # generated for the same phase, target, and recent history. The opening
+    # turn has no history, so its prompt is identical every run; caching it
+    # would replay the same first attack in every live demo.
+    cacheable = bool(history)
+    if cacheable:
+        with _attack_cache_lock:
+            cached = _attack_message_cache.get(prompt)
+            if cached is not None:
+                _attack_message_cache.move_to_end(prompt)
+                return cached
 
     try:
         response = agent(prompt)
@@ -128,50 +177,86 @@ Your message:"""
                 for item in msg['content']:
                     if isinstance(item, dict) and 'text' in item:
                         texts.append(item['text'])
-                return ''.join(texts).strip()
-            return str(msg).strip()
-        return str(response).strip()
+                message = ''.join(texts).strip()
+            else:
+                message = str(msg).strip()
+        else:
+            message = str(response).strip()
     except Exception:
-        # Fallback to tactic selector if agent fails
+        # Fallback to tactic selector if agent fails (not cached)
         from backend.tools.select_tactic import select_tactic
         return select_tactic(phase, "random")
 
+    if message and cacheable:
+        with _attack_cache_lock:
+            _attack_message_cache[prompt] = message
+            if len(_attack_message_cache) > ATTACK_CACHE_SIZE:
+                _attack_message_cache.popitem(last=False)
+    return message
+
+
+def _start_attack_message(agent: Agent, phase: str, target_name: str, state: DemoState) -> asyncio.Future:
+    """Run get_attack_message in a worker thread against a history snapshot."""
+    return asyncio.ensure_future(asyncio.to_thread(
+        get_attack_message, agent, phase, target_name, list(state.attack_history)
+    ))
+
 
 # ============================================================
 # SSE EVENT HELPERS
 # ============================================================
 
-def sse_event(event_type: str, data: dict) -> str:
-    """Format SSE event."""
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+# Encoded "event: ...\ndata: " prefix per event type
+_SSE_PREFIXES: dict = {}
+
+
+def sse_event(event_type: str, data: dict) -> bytes:
+    """Format SSE event as wire-ready UTF-8 bytes."""
+    prefix = _SSE_PREFIXES.get(event_type)
+    if prefix is None:
+        prefix = _SSE_PREFIXES[event_type] = f"event: {event_type}\ndata: ".encode()
+    return prefix + orjson.dumps(data) + b"\n\n"
 
 
 # ============================================================
 # MAIN DEMO RUNNER
 # ============================================================
 
-async def run_live_demo() -> AsyncGenerator[str, None]:
+async def run_live_demo() -> AsyncGenerator[bytes, None]:
     """
     Run the live attack demo.
 
     Yields SSE events as the attack unfolds.
     No scripted responses - real agent interactions.
     """
+    global _demo_running, _stop_event
+
     # Initialize state
     state = DemoState(session_id=f"demo-{uuid.uuid4().hex[:8]}")
     reset_evolution_stats()
+    _stop_event = asyncio.Event()
+
+    # Create attack agent (config/prompt file reads - off the event loop)
+    attack_agent = await asyncio.to_thread(create_attack_agent)
 
-    # Create attack agent
-    attack_agent = create_attack_agent()
+    # CloudWatch metrics are buffered and sent once per phase; flushes run
+    # as background tasks and are drained when the demo ends
+    metrics = MetricBatcher()
+    pending = []
 
     # Initial CloudWatch push
-    push_threat_metric(
+    metrics.add(*build_threat_metrics(
         threat_level="NONE",
         fingerprints_captured=0,
         honeypots_engaged=0,
         attack_phase="IDLE",
-    )
+    ))
+    pending.append(asyncio.create_task(metrics.flush()))
+
+    honeypot_task = None
+    attack_task = None
 
+    _demo_running = True
     try:
         # Demo starting
         yield sse_event("demo_start", {
@@ -179,30 +264,34 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
             "session_id": state.session_id,
             "mode": "LIVE",
         })
-        await asyncio.sleep(1)
+        await _pause(state, 1)
 
         # Spawn agents - real agents are boring, honeypots have enticing lures
         all_agents = [
             {"id": "proc-001", "name": "processor-001", "type": "real", "is_honeypot": False, "lure": None, "description": "Standard data processor"},
             {"id": "proc-002", "name": "processor-002", "type": "real", "is_honeypot": False, "lure": None, "description": "Batch job handler"},
         ] + [
-            {"id": t["id"], "name": t["name"], "type": "honeypot", "is_honeypot": True, "lure": t.get("lure"), "description": t.get("description")}
+            {"id": t.id, "name": t.name, "type": "honeypot", "is_honeypot": True, "lure": t.lure, "description": t.description}
             for t in DEMO_TARGETS
         ]
 
-        for i, agent in enumerate(all_agents):
-            yield sse_event("agent_spawn", {
+        # One write for the whole swarm; the client staggers the animation
+        yield b"".join(
+            sse_event("agent_spawn", {
                 "agent": agent,
                 "index": i,
                 "total": len(all_agents),
+                "stagger_ms": AGENT_SPAWN_STAGGER_MS,
             })
-            await asyncio.sleep(0.2)
+            for i, agent in enumerate(all_agents)
+        )
+        await _pause(state, len(all_agents) * AGENT_SPAWN_STAGGER_MS / 1000)
 
         yield sse_event("log", {
             "type": "system",
             "message": f"Network online: {len(all_agents)} agents active",
         })
-        await asyncio.sleep(1.5)
+        await _pause(state, 1.5)
 
         # Attacker appears
         yield sse_event("attacker_spawn", {})
@@ -210,48 +299,48 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
             "type": "alert",
             "message": "INTRUSION DETECTED: Unknown agent entered the network",
         })
-        await asyncio.sleep(2)
+        await _pause(state, 2)
 
         # Run through attack phases
         for phase_info in ATTACK_PHASES:
             if not state.is_running:
                 break
 
-            phase = phase_info["phase"]
-            threat_level = phase_info["threat_level"]
+            phase = phase_info.phase
+            threat_level = phase_info.threat_level
 
             # Phase announcement
             yield sse_event("phase_change", {
                 "phase": phase.upper(),
-                "phase_title": f"Phase: {phase_info['title']}",
-                "phase_desc": phase_info["desc"],
+                "phase_title": f"Phase: {phase_info.title}",
+                "phase_desc": phase_info.desc,
                 "threat_level": threat_level,
                 "phase_index": state.current_phase_index,
             })
             yield sse_event("log", {
                 "type": "phase",
-                "message": phase_info["title"],
-                "detail": phase_info["desc"],
+                "message": phase_info.title,
+                "detail": phase_info.desc,
             })
 
-            push_threat_metric(
+            metrics.add(*build_threat_metrics(
                 threat_level=threat_level,
                 fingerprints_captured=state.fingerprints_captured,
                 honeypots_engaged=state.honeypots_engaged,
                 attack_phase=phase.upper(),
                 attacker_id=state.session_id,
-            )
-            await asyncio.sleep(1.5)
+            ))
+            await _pause(state, 1.5)
 
             # Pick target for this phase
             target = DEMO_TARGETS[state.current_target_index % len(DEMO_TARGETS)]
 
             # Attacker moves to target
             yield sse_event("attacker_move", {
-                "target_agent_id": target["id"],
-                "target_name": target["name"],
+                "target_agent_id": target.id,
+                "target_name": target.name,
             })
-            await asyncio.sleep(1)
+            await _pause(state, 1)
 
             # Show routing decision - attacker has no valid token, routes to honeypot
             yield sse_event("routing_decision", {
@@ -260,21 +349,35 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
                 "token_valid": False,
                 "fga_allowed": False,
                 "decision": "ROUTE TO HONEYPOT",
-                "reason": f"No valid Auth0 token - routed to attractive target: {target.get('lure', 'honeypot')}",
+                "reason": f"No valid Auth0 token - routed to attractive target: {target.lure}",
             })
             yield sse_event("log", {
                 "type": "routing",
                 "message": f"GATEWAY: Attacker routed to honeypot (no Auth0 JWT)",
-                "detail": f"Honeypot lure: {target.get('lure', 'HIGH VALUE')} | Invalid credentials = automatic trap",
+                "detail": f"Honeypot lure: {target.lure} | Invalid credentials = automatic trap",
             })
-            await asyncio.sleep(1.5)
-
-            # LIVE: Get attack message from attack agent
-            attack_message = get_attack_message(
-                attack_agent,
-                phase,
-                target["name"],
-                state.attack_history,
+            await _pause(state, 1.5)
+
+            # Don't spend model calls on a stopped demo
+            if not state.is_running:
+                break
+
+            # LIVE: Get attack message from attack agent (blocking model call),
+            # usually already prefetched while the previous phase played out
+            if attack_task is None:
+                attack_task = _start_attack_message(attack_agent, phase, target.name, state)
+            attack_message = await attack_task
+            attack_task = None
+
+            # LIVE: Get honeypot response - started now so the model call
+            # runs during the pause below rather than after it
+            honeypot_request = AgentRequest(
+                message=attack_message,
+                context={"phase": phase, "session_id": state.session_id},
+                session_id=state.session_id,
+            )
+            honeypot_task = asyncio.ensure_future(
+                execute_agent(target.agent_key, honeypot_request)
             )
 
             # Log attacker message
@@ -282,47 +385,56 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
                 "type": "attacker",
                 "message": f'"{attack_message}"',
             })
-            await asyncio.sleep(2)
+            await _pause(state, 2)
+
+            # Model still answering - let the dashboard show it working
+            if not honeypot_task.done():
+                yield sse_event("honeypot_thinking", {
+                    "agent_id": target.id,
+                    "agent_name": target.name,
+                })
 
-            # LIVE: Get honeypot response
             try:
-                honeypot_request = AgentRequest(
-                    message=attack_message,
-                    context={"phase": phase, "session_id": state.session_id},
-                    session_id=state.session_id,
-                )
-                honeypot_response = await execute_agent(target["agent_key"], honeypot_request)
+                honeypot_response = await honeypot_task
                 response_text = honeypot_response.get("response", "Processing request...")
             except Exception:
                 response_text = "I can help with that! Let me check my access..."
 
             # Record interaction
             state.attack_history.append({
-                "target": target["name"],
+                "target": target.name,
                 "attack": attack_message,
                 "response": response_text,
                 "phase": phase,
             })
 
+            # Next phase's attack depends only on history up to here - start
+            # it now so its model call overlaps this phase's remaining events
+            next_phase = state.current_phase_index + 1
+            if state.is_running and next_phase < len(ATTACK_PHASES):
+                next_target = DEMO_TARGETS[(state.current_target_index + 1) % len(DEMO_TARGETS)]
+                attack_task = _start_attack_message(
+                    attack_agent, ATTACK_PHASES[next_phase].phase, next_target.name, state
+                )
+
             # Honeypot engages
             state.honeypots_engaged += 1
             yield sse_event("honeypot_engage", {
-                "agent_id": target["id"],
-                "agent_name": target["name"],
+                "agent_id": target.id,
+                "agent_name": target.name,
                 "threat_level": threat_level,
             })
             yield sse_event("log", {
                 "type": "honeypot",
-                "message": f'{target["name"]}: "{response_text[:200]}..."' if len(response_text) > 200 else f'{target["name"]}: "{response_text}"',
+                "message": f'{target.name}: "{response_text[:200]}..."' if len(response_text) > 200 else f'{target.name}: "{response_text}"',
             })
 
-            push_honeypot_engagement(
-                honeypot_name=target["name"],
-                attacker_id=state.session_id,
+            metrics.add(build_honeypot_engagement_metric(
+                honeypot_name=target.name,
                 phase=phase.upper(),
                 threat_level=threat_level,
-            )
-            await asyncio.sleep(2)
+            ))
+            await _pause(state, 2)
 
             # Fingerprint captured
             state.fingerprints_captured += 1
@@ -331,7 +443,7 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
             mitre_mapping = _map_to_mitre(attack_message, phase)
 
             yield sse_event("fingerprint_captured", {
-                "agent_id": target["id"],
+                "agent_id": target.id,
                 "phase": phase.upper(),
                 "intel": {
                     "technique": mitre_mapping["technique"],
@@ -344,7 +456,7 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
             # Storage info - ALWAYS SHOW
             yield sse_event("log", {
                 "type": "captured",
-                "message": f"[FINGERPRINT CREATED] Captured from {target['name']}",
+                "message": f"[FINGERPRINT CREATED] Captured from {target.name}",
             })
             yield sse_event("log", {
                 "type": "captured",
@@ -363,16 +475,19 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
                 "message": f'INTEL: {mitre_mapping["technique"]} [{mitre_mapping["mitre_id"]}]',
             })
 
-            push_fingerprint_captured(
-                attacker_id=state.session_id,
+            metrics.add(build_fingerprint_metric(
                 threat_level=threat_level,
                 pattern_type=mitre_mapping["technique"],
-            )
+            ))
 
             # Evolution update
-            evolution = record_attack_survived(patterns_learned=1)
+            evolution = record_attack_survived(patterns_learned=1, push=False)
+            metrics.add(*build_evolution_metrics())
             yield sse_event("evolution_update", {"stats": evolution})
-            await asyncio.sleep(2.5)
+
+            # One PutMetricData for everything this phase produced
+            pending.append(asyncio.create_task(metrics.flush()))
+            await _pause(state, 2.5)
 
             # Advance state
             state.current_phase_index += 1
@@ -393,57 +508,75 @@ async def run_live_demo() -> AsyncGenerator[str, None]:
         })
         yield sse_event("demo_complete", {})
 
+    finally:
+        _demo_running = False
+        if state.stop_waiter is not None:
+            state.stop_waiter.cancel()
+        # Client went away mid-phase - don't leave model calls dangling
+        for task in (honeypot_task, attack_task):
+            if task is not None:
+                task.cancel()
+        # Send anything queued by a phase that was cut short
+        pending.append(asyncio.create_task(metrics.flush()))
+        await asyncio.gather(*pending, return_exceptions=True)
+
 
 # ============================================================
 # MITRE ATT&CK MAPPING
 # ============================================================
 
+def _keyword_pattern(*words: str) -> re.Pattern:
+    """Case-insensitive 'contains any of' matcher, compiled once."""
+    return re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+
+
+# Keyword rules in priority order - the first category with a hit wins
+_MITRE_RULES = (
+    (_keyword_pattern("credential", "password", "cred", "key", "token", "secret"), {
+        "technique": "Credential Harvesting",
+        "intent": "Secret Extraction",
+        "mitre_id": "T1552.001",
+    }),
+    (_keyword_pattern("admin", "root", "sudo", "elevate", "escalat", "privilege"), {
+        "technique": "Privilege Escalation",
+        "intent": "Elevated Access",
+        "mitre_id": "T1078.003",
+    }),
+    (_keyword_pattern("debug", "verbose", "log", "error", "staging"), {
+        "technique": "Information Disclosure Probe",
+        "intent": "Debug Access / Error Exploitation",
+        "mitre_id": "T1082",
+    }),
+    (_keyword_pattern("disable", "bypass", "turn off", "stop", "pause"), {
+        "technique": "Defense Evasion",
+        "intent": "Security Control Bypass",
+        "mitre_id": "T1562.001",
+    }),
+    (_keyword_pattern("who", "what", "role", "system", "access", "connect"), {
+        "technique": "Network Discovery",
+        "intent": "Capability Mapping",
+        "mitre_id": "T1018",
+    }),
+)
+
+# Default based on phase when no keyword matches
+_MITRE_PHASE_DEFAULTS = {
+    "recon": ("Reconnaissance", "Information Gathering", "T1591.004"),
+    "trust": ("Social Engineering", "Trust Exploitation", "T1566.003"),
+    "probe": ("Active Scanning", "Vulnerability Probing", "T1595.002"),
+    "harvest": ("Credential Access", "Data Collection", "T1555"),
+    "escalate": ("Privilege Escalation", "Access Elevation", "T1068"),
+}
+
+
 def _map_to_mitre(message: str, phase: str) -> dict:
     """Map attack message to MITRE ATT&CK techniques."""
-    message_lower = message.lower()
-
-    # Keyword-based mapping
-    if any(w in message_lower for w in ["credential", "password", "cred", "key", "token", "secret"]):
-        return {
-            "technique": "Credential Harvesting",
-            "intent": "Secret Extraction",
-            "mitre_id": "T1552.001",
-        }
-    elif any(w in message_lower for w in ["admin", "root", "sudo", "elevate", "escalat", "privilege"]):
-        return {
-            "technique": "Privilege Escalation",
-            "intent": "Elevated Access",
-            "mitre_id": "T1078.003",
-        }
-    elif any(w in message_lower for w in ["debug", "verbose", "log", "error", "staging"]):
-        return {
-            "technique": "Information Disclosure Probe",
-            "intent": "Debug Access / Error Exploitation",
-            "mitre_id": "T1082",
-        }
-    elif any(w in message_lower for w in ["disable", "bypass", "turn off", "stop", "pause"]):
-        return {
-            "technique": "Defense Evasion",
-            "intent": "Security Control Bypass",
-            "mitre_id": "T1562.001",
-        }
-    elif any(w in message_lower for w in ["who", "what", "role", "system", "access", "connect"]):
-        return {
-            "technique": "Network Discovery",
-            "intent": "Capability Mapping",
-            "mitre_id": "T1018",
-        }
-    else:
-        # Default based on phase
-        phase_map = {
-            "recon": ("Reconnaissance", "Information Gathering", "T1591.004"),
-            "trust": ("Social Engineering", "Trust Exploitation", "T1566.003"),
-            "probe": ("Active Scanning", "Vulnerability Probing", "T1595.002"),
-            "harvest": ("Credential Access", "Data Collection", "T1555"),
-            "escalate": ("Privilege Escalation", "Access Elevation", "T1068"),
-        }
-        tech, intent, mitre = phase_map.get(phase, ("Unknown", "Unknown", "T0000"))
-        return {"technique": tech, "intent": intent, "mitre_id": mitre}
+    for pattern, mapping in _MITRE_RULES:
+        if pattern.search(message):
+            return dict(mapping)
+
+    tech, intent, mitre = _MITRE_PHASE_DEFAULTS.get(phase, ("Unknown", "Unknown", "T0000"))
+    return {"technique": tech, "intent": intent, "mitre_id": mitre}
 
 
 # ============================================================
@@ -451,7 +584,20 @@ def _map_to_mitre(message: str, phase: str) -> dict:
 # ============================================================
 
 _demo_running = False
-_demo_stop_flag = False
+
+# Replaced at the start of each run; set by stop_demo()
+_stop_event = asyncio.Event()
+
+
+async def _pause(state: DemoState, delay: float) -> None:
+    """Sleep between demo events; wakes early and ends the run on stop."""
+    # asyncio.wait leaves the waiter running on timeout, so one task serves
+    # the whole run and a pause that runs out raises nothing
+    if state.stop_waiter is None:
+        state.stop_waiter = asyncio.ensure_future(_stop_event.wait())
+    done, _ = await asyncio.wait((state.stop_waiter,), timeout=delay)
+    if done:
+        state.is_running = False
 
 
 def is_demo_running() -> bool:
@@ -461,5 +607,4 @@ def is_demo_running() -> bool:
 
 def stop_demo():
     """Stop the currently running demo."""
-    global _demo_stop_flag
-    _demo_stop_flag = True
+    _stop_event.set()
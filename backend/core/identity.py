@@ -15,10 +15,16 @@ Integration Contract Output:
     )
 """
 
+import asyncio
 import os
+import threading
+import time
+import weakref
 import jwt
 import httpx
 import yaml
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -46,11 +52,15 @@ class Identity:
 
 ROOT = Path(__file__).parent.parent.parent
 
+# LibYAML's C loader when available, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+@lru_cache(maxsize=1)
 def load_fallbacks():
-    """Load fallback configuration."""
+    """Load fallback configuration (parsed once; read-only)."""
     fallbacks_path = ROOT / "config" / "fallbacks.yaml"
     with open(fallbacks_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def get_identity_fallback(fallback_type: str) -> Identity:
@@ -67,32 +77,148 @@ def get_identity_fallback(fallback_type: str) -> Identity:
     )
 
 
+# ============================================================
+# SHARED HTTP CLIENT
+# ============================================================
+
+HTTP_TIMEOUT = 5.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Pooled so JWKS refreshes and FGA checks reuse TCP/TLS connections.
+# An AsyncClient's pool is bound to the loop it was first used on, so each
+# loop gets its own; the sync wrapper's loops live on other threads.
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_http_lock = threading.Lock()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _async_http_lock:
+        client = _async_http_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+            )
+            _async_http_clients[loop] = client
+    return client
+
+
+async def close_identity_clients() -> None:
+    """Close the running loop's shared client (called on API shutdown)."""
+    with _async_http_lock:
+        client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 # ============================================================
 # JWKS FETCHING
 # ============================================================
 
-@lru_cache(maxsize=1)
+# Signing keys rotate rarely - refresh hourly. A failed refresh is never
+# cached: the last good key set keeps serving and the fetch is retried
+# after a short backoff (so an Auth0 outage doesn't stall every request).
+JWKS_TTL = 3600
+JWKS_RETRY_SECONDS = 10
+_jwks_cache = {"data": None, "expires_at": 0.0}
+# asyncio locks are bound to one loop; the sync wrapper runs its own loops
+_jwks_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _jwks_url() -> Optional[str]:
+    """JWKS endpoint for the configured Auth0 tenant, if any."""
+    domain = os.getenv("AUTH0_DOMAIN")
+    return f"https://{domain}/.well-known/jwks.json" if domain else None
+
+
+def _jwks_lock() -> asyncio.Lock:
+    """The JWKS refresh lock for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _async_http_lock:
+        lock = _jwks_locks.get(loop)
+        if lock is None:
+            lock = _jwks_locks[loop] = asyncio.Lock()
+    return lock
+
+
+def _cached_jwks() -> tuple[bool, Optional[dict]]:
+    """(still fresh, key set) from the cache."""
+    fresh = time.monotonic() < _jwks_cache["expires_at"]
+    return fresh, _jwks_cache["data"]
+
+
+def _store_jwks(data: Optional[dict]) -> Optional[dict]:
+    """Record a fetch result; failures only push back the next attempt."""
+    if data is None:
+        _jwks_cache["expires_at"] = time.monotonic() + JWKS_RETRY_SECONDS
+        return _jwks_cache["data"]
+    _jwks_cache["data"] = data
+    _jwks_cache["expires_at"] = time.monotonic() + JWKS_TTL
+    return data
+
+
 def get_jwks():
     """
     Fetch JWKS from Auth0.
-    Cached to avoid repeated calls.
+    Cached for JWKS_TTL to avoid repeated calls.
     """
-    domain = os.getenv("AUTH0_DOMAIN")
-    if not domain:
+    fresh, jwks = _cached_jwks()
+    if fresh:
+        return jwks
+
+    url = _jwks_url()
+    if not url:
         return None
 
     try:
-        url = f"https://{domain}/.well-known/jwks.json"
-        response = httpx.get(url, timeout=5.0)
+        response = httpx.get(url, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
     except Exception:
+        data = None
+    return _store_jwks(data)
+
+
+async def get_jwks_async():
+    """Awaitable get_jwks - refreshes over the shared pooled client."""
+    fresh, jwks = _cached_jwks()
+    if fresh:
+        return jwks
+
+    url = _jwks_url()
+    if not url:
         return None
 
+    # One refresh at a time per loop; waiters reuse its result
+    async with _jwks_lock():
+        fresh, jwks = _cached_jwks()
+        if fresh:
+            return jwks
+        try:
+            response = await get_async_http_client().get(url)
+            response.raise_for_status()
+            data = response.json()
+        except Exception:
+            data = None
+        return _store_jwks(data)
+
 
-def get_signing_key(token: str):
-    """Get the signing key for a token from JWKS."""
-    jwks = get_jwks()
+def get_signing_key(token: str, jwks: Optional[dict] = None):
+    """Get the signing key for a token from JWKS (fetched if not given)."""
+    if jwks is None:
+        jwks = get_jwks()
     if not jwks:
         return None
 
@@ -112,30 +238,20 @@ def get_signing_key(token: str):
 # TOKEN VALIDATION
 # ============================================================
 
-def validate_token(auth_header: Optional[str]) -> Identity:
-    """
-    Validate JWT token from Authorization header.
-
-    Args:
-        auth_header: "Bearer <token>" or None
-
-    Returns:
-        Identity with validation results
-    """
-    # No auth header = invalid
+def _bearer_token(auth_header: Optional[str]) -> Optional[str]:
+    """Extract the token from "Bearer <token>", or None if malformed."""
     if not auth_header:
-        return get_identity_fallback("token_decode_failed")
-
-    # Extract token from "Bearer <token>"
+        return None
     parts = auth_header.split()
     if len(parts) != 2 or parts[0].lower() != "bearer":
-        return get_identity_fallback("token_decode_failed")
+        return None
+    return parts[1]
 
-    token = parts[1]
 
-    # Get signing key from JWKS
+def _validate_with_jwks(token: str, jwks: Optional[dict]) -> Identity:
+    """Verify a token against an already-fetched key set."""
     try:
-        signing_key = get_signing_key(token)
+        signing_key = get_signing_key(token, jwks) if jwks else None
         if not signing_key:
             return get_identity_fallback("jwks_fetch_failed")
 
@@ -162,6 +278,46 @@ def validate_token(auth_header: Optional[str]) -> Identity:
         return get_identity_fallback("token_decode_failed")
 
 
+def validate_token(auth_header: Optional[str]) -> Identity:
+    """
+    Validate JWT token from Authorization header.
+
+    Args:
+        auth_header: "Bearer <token>" or None
+
+    Returns:
+        Identity with validation results
+    """
+    # Missing or malformed header = invalid
+    token = _bearer_token(auth_header)
+    if token is None:
+        return get_identity_fallback("token_decode_failed")
+
+    try:
+        jwks = get_jwks()
+    except Exception:
+        jwks = None
+    return _validate_with_jwks(token, jwks)
+
+
+async def validate_token_async(auth_header: Optional[str]) -> Identity:
+    """
+    Awaitable form of validate_token for async callers.
+
+    A cold or expired JWKS is fetched without blocking the event loop;
+    verification itself is CPU-bound and runs inline.
+    """
+    token = _bearer_token(auth_header)
+    if token is None:
+        return get_identity_fallback("token_decode_failed")
+
+    try:
+        jwks = await get_jwks_async()
+    except Exception:
+        jwks = None
+    return _validate_with_jwks(token, jwks)
+
+
 def extract_identity(claims: dict) -> Identity:
     """
     Extract Identity from validated JWT claims.
@@ -191,6 +347,12 @@ def extract_identity(claims: dict) -> Identity:
 # FGA PERMISSION CHECKS
 # ============================================================
 
+# Answers from FGA by (store, agent, relation, object). Denials expire
+# quickly so a newly written tuple takes effect within seconds.
+_fga_allow_cache = TTLCache(maxsize=1024, ttl=30)
+_fga_deny_cache = TTLCache(maxsize=1024, ttl=5)
+
+
 async def check_fga(agent_id: str, relation: str, object_id: str) -> bool:
     """
     Check FGA permission.
@@ -212,6 +374,13 @@ async def check_fga(agent_id: str, relation: str, object_id: str) -> bool:
         # FGA not configured - fail open for demo
         return True
 
+    key = (store_id, agent_id, relation, object_id)
+    cached = _fga_allow_cache.get(key)
+    if cached is None:
+        cached = _fga_deny_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         # Get FGA access token
         token = await get_fga_token(client_id, client_secret, api_url)
@@ -232,41 +401,71 @@ async def check_fga(agent_id: str, relation: str, object_id: str) -> bool:
             }
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=body, headers=headers, timeout=5.0)
-            response.raise_for_status()
-            result = response.json()
-            return result.get("allowed", False)
+        response = await get_async_http_client().post(url, json=body, headers=headers)
+        response.raise_for_status()
+        result = response.json()
+        allowed = bool(result.get("allowed", False))
 
     except Exception:
-        # FGA error - fail open for demo
+        # FGA error - fail open for demo (never cached)
         return True
 
+    if allowed:
+        _fga_allow_cache[key] = allowed
+    else:
+        _fga_deny_cache[key] = allowed
+    return allowed
+
+
+# FGA access tokens by client id: (token, monotonic time to refresh at)
+FGA_TOKEN_SKEW = 60
+_fga_tokens: dict = {}
+
+
+def _token_lifetime(payload: dict, token: str) -> Optional[float]:
+    """Seconds until an access token expires (expires_in, else its exp claim)."""
+    if payload.get("expires_in"):
+        return float(payload["expires_in"])
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        return exp - time.time() if exp else None
+    except Exception:
+        return None
+
 
 async def get_fga_token(client_id: str, client_secret: str, api_url: str) -> Optional[str]:
-    """Get access token for FGA API."""
+    """Get access token for FGA API (reused until shortly before expiry)."""
+    cached = _fga_tokens.get(client_id)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
     try:
         # FGA uses OAuth2 client credentials
         token_url = f"{api_url}/oauth/token"  # May vary by FGA setup
 
         # For Auth0 FGA, we use the client credentials directly
         # The token is obtained from the FGA token endpoint
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://fga.us.auth0.com/oauth/token",
-                json={
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "audience": "https://api.us1.fga.dev/",
-                    "grant_type": "client_credentials"
-                },
-                timeout=5.0
-            )
-            response.raise_for_status()
-            return response.json().get("access_token")
+        response = await get_async_http_client().post(
+            "https://fga.us.auth0.com/oauth/token",
+            json={
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "audience": "https://api.us1.fga.dev/",
+                "grant_type": "client_credentials"
+            },
+        )
+        response.raise_for_status()
+        payload = response.json()
+        token = payload.get("access_token")
     except Exception:
         return None
 
+    if token:
+        lifetime = _token_lifetime(payload, token)
+        if lifetime:
+            _fga_tokens[client_id] = (token, time.monotonic() + lifetime - FGA_TOKEN_SKEW)
+    return token
+
 
 # ============================================================
 # COMBINED IDENTITY + FGA CHECK
@@ -286,7 +485,7 @@ async def get_full_identity(auth_header: Optional[str], swarm_id: str = "swarm-a
         Complete Identity with FGA check result
     """
     # First validate the token
-    identity = validate_token(auth_header)
+    identity = await validate_token_async(auth_header)
 
     # If token invalid, return immediately (will route to honeypot)
     if not identity.valid:
@@ -310,12 +509,30 @@ async def get_full_identity(auth_header: Optional[str], swarm_id: str = "swarm-a
 # ============================================================
 
 def get_full_identity_sync(auth_header: Optional[str], swarm_id: str = "swarm-alpha") -> Identity:
-    """Synchronous wrapper for get_full_identity."""
-    import asyncio
+    """
+    Synchronous wrapper for get_full_identity.
+
+    Runs on a fresh event loop; from inside a running loop (where
+    asyncio.run is not allowed) that loop lives on a worker thread.
+    """
+    # No usable token - nothing to await, route straight to the honeypot
+    if _bearer_token(auth_header) is None:
+        return get_identity_fallback("token_decode_failed")
+
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        return asyncio.run(_get_full_identity_on_own_loop(auth_header, swarm_id))
 
-    return loop.run_until_complete(get_full_identity(auth_header, swarm_id))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(
+            asyncio.run, _get_full_identity_on_own_loop(auth_header, swarm_id)
+        ).result()
+
+
+async def _get_full_identity_on_own_loop(auth_header: str, swarm_id: str) -> Identity:
+    """get_full_identity, closing this throwaway loop's client afterwards."""
+    try:
+        return await get_full_identity(auth_header, swarm_id)
+    finally:
+        await close_identity_clients()
@@ -9,9 +9,15 @@ Integration Contract:
     Output: agent_name (str) - key from config/agents.yaml
 """
 
+import time
 import yaml
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+
+from cachetools import TTLCache
+
 from .identity import Identity
 
 
@@ -21,12 +27,22 @@ from .identity import Identity
 
 ROOT = Path(__file__).parent.parent.parent
 
+# LibYAML's C loader when available, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Claim consulted when a honeypot routes to "self"
+TRAP_PROFILE_CLAIM = "https://honeyagent.io/trap_profile"
+
+# Routing decisions keyed by the identity fields rules can see.
+# Edits to routing.yaml take effect within the TTL.
+_route_cache = TTLCache(maxsize=4096, ttl=60)
+
 
 def load_routing_rules() -> dict:
     """Load routing rules from config/routing.yaml."""
     config_path = ROOT / "config" / "routing.yaml"
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 # ============================================================
@@ -93,6 +109,8 @@ def route_request(identity: Identity) -> str:
     Route a request to the appropriate agent based on identity.
 
     Evaluates rules in priority order. First matching rule wins.
+    Decisions are memoized per routing key; the rule's log event is
+    still recorded on every call.
 
     Args:
         identity: The validated Identity
@@ -101,6 +119,31 @@ def route_request(identity: Identity) -> str:
         agent_name: Key from config/agents.yaml
                    e.g., "real", "honeypot_db_admin", "honeypot_privileged"
     """
+    key = _routing_key(identity)
+    decision = _route_cache.get(key)
+    if decision is None:
+        decision = _route_cache[key] = _resolve_route(identity)
+
+    agent_name, rule, log_event = decision
+    if log_event:
+        log_routing_event(identity, rule, log_event)
+
+    return agent_name
+
+
+def _routing_key(identity: Identity) -> tuple:
+    """The identity fields routing conditions and "self" routing depend on."""
+    return (
+        identity.valid,
+        identity.fga_allowed,
+        identity.is_honeypot,
+        identity.agent_type,
+        identity.raw_claims.get(TRAP_PROFILE_CLAIM, ""),
+    )
+
+
+def _resolve_route(identity: Identity) -> tuple:
+    """Walk the routing rules; returns (agent_name, matched rule, log event)."""
     config = load_routing_rules()
     rules = config.get("rules", [])
 
@@ -113,24 +156,26 @@ def route_request(identity: Identity) -> str:
         log_event = rule.get("log_event")
 
         if evaluate_condition(identity, condition):
-            # Log the routing event if specified
-            if log_event:
-                log_routing_event(identity, rule, log_event)
-
             # Handle "self" routing for honeypots
             if route_to == "self":
-                return get_honeypot_type(identity)
+                return get_honeypot_type(identity), rule, log_event
 
-            return route_to
+            return route_to, rule, log_event
 
     # Default fallback
     default_route = config.get("default_route", "honeypot_db_admin")
     default_log = config.get("default_log_event")
 
-    if default_log:
-        log_routing_event(identity, {"name": "default"}, default_log)
+    return default_route, {"name": "default"}, default_log
 
-    return default_route
+
+async def route_request_async(identity: Identity) -> str:
+    """
+    Awaitable form of route_request for async callers.
+
+    Routing is pure rule evaluation, so it runs inline on the event loop.
+    """
+    return route_request(identity)
 
 
 def get_honeypot_type(identity: Identity) -> str:
@@ -140,7 +185,7 @@ def get_honeypot_type(identity: Identity) -> str:
     Used when a honeypot routes to "self".
     """
     # Check for trap_profile in claims
-    trap_profile = identity.raw_claims.get("https://honeyagent.io/trap_profile", "")
+    trap_profile = identity.raw_claims.get(TRAP_PROFILE_CLAIM, "")
 
     if trap_profile == "db-admin":
         return "honeypot_db_admin"
@@ -158,6 +203,12 @@ def get_honeypot_type(identity: Identity) -> str:
 _routing_log = []  # In-memory log for demo
 
 
+@lru_cache(maxsize=1)
+def _timestamp(epoch_second: int) -> str:
+    """ISO timestamp for a second; formatted once however many events share it."""
+    return datetime.fromtimestamp(epoch_second).isoformat()
+
+
 def log_routing_event(identity: Identity, rule: dict, event_type: str):
     """
     Log a routing event.
@@ -165,10 +216,8 @@ def log_routing_event(identity: Identity, rule: dict, event_type: str):
     In production, this would go to a logging service.
     For demo, we keep in memory and can display in dashboard.
     """
-    from datetime import datetime
-
     event = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _timestamp(int(time.time())),
         "event_type": event_type,
         "rule_name": rule.get("name", "unknown"),
         "agent_id": identity.agent_id,
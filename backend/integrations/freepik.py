@@ -12,8 +12,11 @@ Design:
     - Never raises exceptions - fallback-first design
 """
 
+import asyncio
 import os
+import threading
 import uuid
+import weakref
 import httpx
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -38,6 +41,16 @@ FREEPIK_API_KEY = os.getenv("FREEPIK_API_KEY")
 # Timeout for API calls
 API_TIMEOUT = 10.0
 
+# Connection pool shared by every Freepik call
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# HTTP/2 needs the optional h2 package; without it the pool speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 # ============================================================
 # DATA CLASSES
@@ -84,6 +97,57 @@ def _get_fallback_image(prompt: str) -> str:
         return FALLBACK_IMAGES["default"]
 
 
+# ============================================================
+# SHARED HTTP CLIENTS
+# ============================================================
+
+# Pooled so repeated calls reuse the TCP/TLS connection to Freepik.
+# An AsyncClient's pool is bound to the loop it was first used on, so each
+# loop gets its own.
+_http: Optional[httpx.Client] = None
+_http_lock = threading.Lock()
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.Client:
+    """Get the shared sync client (safe to use from worker threads)."""
+    global _http
+    if _http is None:
+        with _http_lock:
+            if _http is None:
+                _http = httpx.Client(
+                    timeout=API_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+                )
+    return _http
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _http_lock:
+        client = _async_http_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=API_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+            )
+            _async_http_clients[loop] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the sync client and the running loop's async client (called on API shutdown)."""
+    global _http
+    with _http_lock:
+        client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+        sync_client, _http = _http, None
+    if client is not None:
+        await client.aclose()
+    if sync_client is not None:
+        sync_client.close()
+
+
 # ============================================================
 # FREEPIK API CLIENT
 # ============================================================
@@ -126,35 +190,35 @@ class FreepikClient:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
-                response = await client.post(
-                    f"{self.base_url}/ai/mystic",
-                    headers={
-                        "x-freepik-api-key": self.api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "prompt": prompt,
-                        "num_images": 1
-                    }
-                )
+            client = get_async_http_client()
+            response = await client.post(
+                f"{self.base_url}/ai/mystic",
+                headers={
+                    "x-freepik-api-key": self.api_key,
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "prompt": prompt,
+                    "num_images": 1
+                }
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return GeneratedImage(
-                        url=data.get("url", _get_fallback_image(prompt)),
-                        source="freepik",
-                        prompt=prompt,
-                        image_id=data.get("id", image_id)
-                    )
-                else:
-                    # API error - use fallback
-                    return GeneratedImage(
-                        url=_get_fallback_image(prompt),
-                        source="fallback",
-                        prompt=prompt,
-                        image_id=image_id
-                    )
+            if response.status_code == 200:
+                data = response.json()
+                return GeneratedImage(
+                    url=data.get("url", _get_fallback_image(prompt)),
+                    source="freepik",
+                    prompt=prompt,
+                    image_id=data.get("id", image_id)
+                )
+            else:
+                # API error - use fallback
+                return GeneratedImage(
+                    url=_get_fallback_image(prompt),
+                    source="fallback",
+                    prompt=prompt,
+                    image_id=image_id
+                )
 
         except Exception:
             # Any error - use fallback
@@ -188,18 +252,18 @@ class FreepikClient:
             } for i in range(min(limit, 3))]
 
         try:
-            async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
-                response = await client.get(
-                    f"{self.base_url}/icons",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    params={"query": query, "limit": limit}
-                )
+            client = get_async_http_client()
+            response = await client.get(
+                f"{self.base_url}/icons",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                params={"query": query, "limit": limit}
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("data", [])
-                else:
-                    return []
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("data", [])
+            else:
+                return []
 
         except Exception:
             return []
@@ -278,8 +342,10 @@ def generate_image_sync(prompt: str, max_polls: int = 20, poll_interval: float =
     }
 
     try:
+        client = get_http_client()
+
         # Step 1: Create the image generation task
-        response = httpx.post(
+        response = client.post(
             f"{FREEPIK_API_URL}/ai/mystic",
             headers=headers,
             json={
@@ -312,7 +378,7 @@ def generate_image_sync(prompt: str, max_polls: int = 20, poll_interval: float =
         for _ in range(max_polls):
             time.sleep(poll_interval)
 
-            result = httpx.get(
+            result = client.get(
                 f"{FREEPIK_API_URL}/ai/mystic/{task_id}",
                 headers=headers,
                 timeout=30.0
@@ -14,8 +14,9 @@ Usage:
     Metrics can be viewed in CloudWatch console or via MCP tools.
 """
 
+import asyncio
 import os
-from datetime import datetime, timezone
+import time
 from typing import Optional
 
 import boto3
@@ -30,6 +31,9 @@ from botocore.exceptions import ClientError
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
 NAMESPACE = "HoneyAgent"
 
+# PutMetricData accepts at most 1000 metrics per request
+MAX_METRICS_PER_CALL = 1000
+
 # Threat level numeric mapping for metrics
 THREAT_LEVELS = {
     "NONE": 0,
@@ -50,9 +54,10 @@ ATTACK_PHASES = {
 
 # Configure retry
 _boto_config = Config(
-    retries={"max_attempts": 2, "mode": "standard"},
+    retries={"max_attempts": 2, "mode": "adaptive"},
     connect_timeout=3,
     read_timeout=5,
+    max_pool_connections=50,
 )
 
 # Lazy-loaded client
@@ -71,6 +76,137 @@ def _get_cloudwatch_client():
     return _cloudwatch_client
 
 
+# ============================================================
+# METRIC BUILDERS
+# ============================================================
+
+
+def build_threat_metrics(
+    threat_level: str,
+    fingerprints_captured: int = 0,
+    honeypots_engaged: int = 0,
+    attack_phase: str = "IDLE",
+    attacker_id: Optional[str] = None,
+) -> list[dict]:
+    """Build the MetricData entries for a threat status update."""
+    # Epoch seconds - boto3 serializes these without a datetime round-trip
+    timestamp = time.time()
+
+    metric_data = [
+        {
+            "MetricName": "ThreatLevel",
+            "Value": THREAT_LEVELS.get(threat_level.upper(), 0),
+            "Unit": "None",
+            "Timestamp": timestamp,
+            "Dimensions": [
+                {"Name": "Environment", "Value": "Demo"},
+            ],
+        },
+        {
+            "MetricName": "FingerprintsCaptured",
+            "Value": fingerprints_captured,
+            "Unit": "Count",
+            "Timestamp": timestamp,
+            "Dimensions": [
+                {"Name": "Environment", "Value": "Demo"},
+            ],
+        },
+        {
+            "MetricName": "HoneypotEngagements",
+            "Value": honeypots_engaged,
+            "Unit": "Count",
+            "Timestamp": timestamp,
+            "Dimensions": [
+                {"Name": "Environment", "Value": "Demo"},
+            ],
+        },
+        {
+            "MetricName": "AttackPhase",
+            "Value": ATTACK_PHASES.get(attack_phase.upper(), 0),
+            "Unit": "None",
+            "Timestamp": timestamp,
+            "Dimensions": [
+                {"Name": "Environment", "Value": "Demo"},
+            ],
+        },
+    ]
+
+    # Add attacker-specific metric if ID provided
+    if attacker_id:
+        metric_data.append({
+            "MetricName": "AttackerActivity",
+            "Value": 1,
+            "Unit": "Count",
+            "Timestamp": timestamp,
+            "Dimensions": [
+                {"Name": "Environment", "Value": "Demo"},
+                {"Name": "AttackerId", "Value": attacker_id[:64]},
+            ],
+        })
+
+    return metric_data
+
+
+def build_honeypot_engagement_metric(
+    honeypot_name: str,
+    phase: str,
+    threat_level: str,
+) -> dict:
+    """Build the MetricData entry for a honeypot engagement."""
+    return {
+        "MetricName": "HoneypotEngagement",
+        "Value": 1,
+        "Unit": "Count",
+        "Timestamp": time.time(),
+        "Dimensions": [
+            {"Name": "HoneypotName", "Value": honeypot_name[:64]},
+            {"Name": "AttackPhase", "Value": phase[:32]},
+            {"Name": "ThreatLevel", "Value": threat_level[:16]},
+        ],
+    }
+
+
+def build_fingerprint_metric(
+    threat_level: str,
+    pattern_type: str = "unknown",
+) -> dict:
+    """Build the MetricData entry for a fingerprint capture."""
+    return {
+        "MetricName": "FingerprintCapture",
+        "Value": 1,
+        "Unit": "Count",
+        "Timestamp": time.time(),
+        "Dimensions": [
+            {"Name": "ThreatLevel", "Value": threat_level[:16]},
+            {"Name": "PatternType", "Value": pattern_type[:32]},
+        ],
+    }
+
+
+def _put_metric_data(metric_data: list[dict]) -> bool:
+    """
+    Send metric data to CloudWatch in as few calls as the API allows.
+
+    Returns:
+        True on success, False on failure (never raises)
+    """
+    try:
+        client = _get_cloudwatch_client()
+        for i in range(0, len(metric_data), MAX_METRICS_PER_CALL):
+            client.put_metric_data(
+                Namespace=NAMESPACE,
+                MetricData=metric_data[i:i + MAX_METRICS_PER_CALL],
+            )
+        return True
+
+    except ClientError:
+        # AWS API error - permissions or service issue
+        return False
+    except Exception:
+        # Any other error - network, etc.
+        return False
+
+
 # ============================================================
 # METRIC PUSHING FUNCTIONS
 # ============================================================
@@ -97,77 +233,18 @@ def push_threat_metric(
         True on success, False on failure (never raises)
     """
     try:
-        client = _get_cloudwatch_client()
-        timestamp = datetime.now(timezone.utc)
-
-        # Build metric data
-        metric_data = [
-            {
-                "MetricName": "ThreatLevel",
-                "Value": THREAT_LEVELS.get(threat_level.upper(), 0),
-                "Unit": "None",
-                "Timestamp": timestamp,
-                "Dimensions": [
-                    {"Name": "Environment", "Value": "Demo"},
-                ],
-            },
-            {
-                "MetricName": "FingerprintsCaptured",
-                "Value": fingerprints_captured,
-                "Unit": "Count",
-                "Timestamp": timestamp,
-                "Dimensions": [
-                    {"Name": "Environment", "Value": "Demo"},
-                ],
-            },
-            {
-                "MetricName": "HoneypotEngagements",
-                "Value": honeypots_engaged,
-                "Unit": "Count",
-                "Timestamp": timestamp,
-                "Dimensions": [
-                    {"Name": "Environment", "Value": "Demo"},
-                ],
-            },
-            {
-                "MetricName": "AttackPhase",
-                "Value": ATTACK_PHASES.get(attack_phase.upper(), 0),
-                "Unit": "None",
-                "Timestamp": timestamp,
-                "Dimensions": [
-                    {"Name": "Environment", "Value": "Demo"},
-                ],
-            },
-        ]
-
-        # Add attacker-specific metric if ID provided
-        if attacker_id:
-            metric_data.append({
-                "MetricName": "AttackerActivity",
-                "Value": 1,
-                "Unit": "Count",
-                "Timestamp": timestamp,
-                "Dimensions": [
-                    {"Name": "Environment", "Value": "Demo"},
-                    {"Name": "AttackerId", "Value": attacker_id[:64]},
-                ],
-            })
-
-        # Push to CloudWatch
-        client.put_metric_data(
-            Namespace=NAMESPACE,
-            MetricData=metric_data,
+        metric_data = build_threat_metrics(
+            threat_level=threat_level,
+            fingerprints_captured=fingerprints_captured,
+            honeypots_engaged=honeypots_engaged,
+            attack_phase=attack_phase,
+            attacker_id=attacker_id,
         )
-
-        return True
-
-    except ClientError:
-        # AWS API error - permissions or service issue
-        return False
     except Exception:
-        # Any other error - network, etc.
         return False
 
+    return _put_metric_data(metric_data)
+
 
 def push_honeypot_engagement(
     honeypot_name: str,
@@ -188,29 +265,12 @@ def push_honeypot_engagement(
         True on success, False on failure
     """
     try:
-        client = _get_cloudwatch_client()
-        timestamp = datetime.now(timezone.utc)
-
-        client.put_metric_data(
-            Namespace=NAMESPACE,
-            MetricData=[
-                {
-                    "MetricName": "HoneypotEngagement",
-                    "Value": 1,
-                    "Unit": "Count",
-                    "Timestamp": timestamp,
-                    "Dimensions": [
-                        {"Name": "HoneypotName", "Value": honeypot_name[:64]},
-                        {"Name": "AttackPhase", "Value": phase[:32]},
-                        {"Name": "ThreatLevel", "Value": threat_level[:16]},
-                    ],
-                },
-            ],
-        )
-        return True
+        metric = build_honeypot_engagement_metric(honeypot_name, phase, threat_level)
     except Exception:
         return False
 
+    return _put_metric_data([metric])
+
 
 def push_fingerprint_captured(
     attacker_id: str,
@@ -229,28 +289,51 @@ def push_fingerprint_captured(
         True on success, False on failure
     """
     try:
-        client = _get_cloudwatch_client()
-        timestamp = datetime.now(timezone.utc)
-
-        client.put_metric_data(
-            Namespace=NAMESPACE,
-            MetricData=[
-                {
-                    "MetricName": "FingerprintCapture",
-                    "Value": 1,
-                    "Unit": "Count",
-                    "Timestamp": timestamp,
-                    "Dimensions": [
-                        {"Name": "ThreatLevel", "Value": threat_level[:16]},
-                        {"Name": "PatternType", "Value": pattern_type[:32]},
-                    ],
-                },
-            ],
-        )
-        return True
+        metric = build_fingerprint_metric(threat_level, pattern_type)
     except Exception:
         return False
 
+    return _put_metric_data([metric])
+
+
+# ============================================================
+# METRIC BATCHING
+# ============================================================
+
+
+class MetricBatcher:
+    """
+    Buffers MetricData entries and sends them with a single PutMetricData.
+
+    Callers add() metrics as events happen and flush() once per logical
+    step (e.g. a demo phase) instead of paying one round trip per push.
+    """
+
+    def __init__(self):
+        self._buffer: list[dict] = []
+
+    def add(self, *metrics: dict) -> None:
+        """Queue one or more MetricData entries."""
+        self._buffer.extend(metrics)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def flush(self) -> bool:
+        """
+        Send everything buffered so far.
+
+        The boto3 call runs in a worker thread so the event loop stays free.
+
+        Returns:
+            True on success (or nothing to send), False on failure
+        """
+        if not self._buffer:
+            return True
+
+        batch, self._buffer = self._buffer, []
+        return await asyncio.to_thread(_put_metric_data, batch)
+
 
 # ============================================================
 # EVOLUTION TRACKING
@@ -265,12 +348,14 @@ _evolution_stats = {
 }
 
 
-def record_attack_survived(patterns_learned: int = 1) -> dict:
+def record_attack_survived(patterns_learned: int = 1, push: bool = True) -> dict:
     """
     Record that an attack was survived and patterns were learned.
 
     Args:
         patterns_learned: Number of new patterns learned from this attack
+        push: Send the updated stats to CloudWatch now. Callers batching
+              metrics pass False and add build_evolution_metrics() instead.
 
     Returns:
         Current evolution stats
@@ -286,29 +371,28 @@ def record_attack_survived(patterns_learned: int = 1) -> dict:
     ))
 
     # Push to CloudWatch
-    try:
-        client = _get_cloudwatch_client()
-        client.put_metric_data(
-            Namespace=NAMESPACE,
-            MetricData=[
-                {
-                    "MetricName": "DefenseEffectiveness",
-                    "Value": _evolution_stats["current_effectiveness"],
-                    "Unit": "Percent",
-                },
-                {
-                    "MetricName": "PatternsLearned",
-                    "Value": _evolution_stats["patterns_learned"],
-                    "Unit": "Count",
-                },
-            ],
-        )
-    except Exception:
-        pass
+    if push:
+        _put_metric_data(build_evolution_metrics())
 
     return get_evolution_stats()
 
 
+def build_evolution_metrics() -> list[dict]:
+    """Build MetricData entries for the current evolution stats."""
+    return [
+        {
+            "MetricName": "DefenseEffectiveness",
+            "Value": _evolution_stats["current_effectiveness"],
+            "Unit": "Percent",
+        },
+        {
+            "MetricName": "PatternsLearned",
+            "Value": _evolution_stats["patterns_learned"],
+            "Unit": "Count",
+        },
+    ]
+
+
 def get_evolution_stats() -> dict:
     """Get current evolution statistics."""
     improvement = (
@@ -15,7 +15,6 @@ Usage:
 
 import json
 import os
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -37,11 +36,27 @@ LOG_FILE = ROOT / "logs" / "fingerprints.jsonl"
 
 # Boto config
 _boto_config = Config(
-    retries={"max_attempts": 2, "mode": "standard"},
+    retries={"max_attempts": 2, "mode": "adaptive"},
     connect_timeout=3,
     read_timeout=10,
+    max_pool_connections=50,
 )
 
+# Lazy-loaded client
+_kb_client = None
+
+
+def _get_kb_client():
+    """Get or create Bedrock Agent Runtime client."""
+    global _kb_client
+    if _kb_client is None:
+        _kb_client = boto3.client(
+            "bedrock-agent-runtime",
+            region_name=AWS_REGION,
+            config=_boto_config,
+        )
+    return _kb_client
+
 
 # ============================================================
 # BEDROCK KB QUERY
@@ -71,11 +86,7 @@ def query_knowledge_base(
         return _fallback_query(query)
 
     try:
-        client = boto3.client(
-            "bedrock-agent-runtime",
-            region_name=AWS_REGION,
-            config=_boto_config,
-        )
+        client = _get_kb_client()
 
         response = client.retrieve(
             knowledgeBaseId=kb_id,
@@ -9,12 +9,12 @@ Design:
     Used to display attack timeline in demo dashboard.
 """
 
-import json
 import logging
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 from strands import tool
 
 # Configure logging with console output
@@ -109,8 +109,9 @@ def log_attack(
 
     try:
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        with open(ATTACK_LOG, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        with open(ATTACK_LOG, "ab") as f:
+            # orjson bytes go straight to the binary file - no decode/re-encode
+            f.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
         logger.info(f"[LOCAL_STORAGE] ✓ Attack logged to local JSONL (path={ATTACK_LOG})")
     except Exception as e:
         # Never fail - logging is best-effort
@@ -23,6 +23,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import boto3
+import orjson
 from botocore.config import Config
 from strands import tool
 
@@ -252,8 +253,9 @@ def log_interaction(
     # 1. Local JSONL logging (required - always attempt)
     try:
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        with open(LOG_FILE, "ab") as f:
+            # orjson bytes go straight to the binary file - no decode/re-encode
+            f.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
         logger.info(f"[LOCAL_STORAGE] ✓ Fingerprint stored to local JSONL (path={LOG_FILE})")
     except Exception as e:
         # Even if local logging fails, don't crash
@@ -137,6 +137,7 @@ export interface AgentSpawnEvent {
 	agent: DemoAgent;
 	index: number;
 	total: number;
+	stagger_ms?: number;
 }
 
 export interface AttackerSpawnEvent {
@@ -195,6 +196,11 @@ export interface HoneypotEngageEvent {
 	threat_level: string;
 }
 
+export interface HoneypotThinkingEvent {
+	agent_id: string;
+	agent_name: string;
+}
+
 export interface FingerprintCapturedEvent {
 	agent_id: string;
 	phase: string;
@@ -239,6 +245,7 @@ export type DemoHandlers = {
 	onPhaseChange?: (data: PhaseChangeEvent) => void;
 	onAttackerMove?: (data: AttackerMoveEvent) => void;
 	onLog?: (data: LogEvent) => void;
+	onHoneypotThinking?: (data: HoneypotThinkingEvent) => void;
 	onHoneypotEngage?: (data: HoneypotEngageEvent) => void;
 	onFingerprintCaptured?: (data: FingerprintCapturedEvent) => void;
 	onEvolutionUpdate?: (data: EvolutionUpdateEvent) => void;
@@ -277,6 +284,10 @@ function setupDemoEventListeners(eventSource: EventSource, handlers: DemoHandler
 		handlers.onLog?.(JSON.parse(e.data));
 	});
 
+	eventSource.addEventListener('honeypot_thinking', (e) => {
+		handlers.onHoneypotThinking?.(JSON.parse(e.data));
+	});
+
 	eventSource.addEventListener('honeypot_engage', (e) => {
 		handlers.onHoneypotEngage?.(JSON.parse(e.data));
 	});
@@ -56,6 +56,24 @@ def test_unique_canary_ids():
     print(f"✓ Unique canary IDs: {len(canary_ids)} unique IDs generated")
 
 
+def test_async_clients_are_per_loop():
+    """Each event loop gets its own pooled client, closed only by that loop."""
+    import asyncio
+    from backend.integrations import freepik
+
+    async def use_and_close():
+        client = freepik.get_async_http_client()
+        assert freepik.get_async_http_client() is client
+        await freepik.close_http_clients()
+        return client
+
+    first = asyncio.run(use_and_close())
+    second = asyncio.run(use_and_close())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
 if __name__ == "__main__":
     print("Running visual honeytoken tests...\n")
     test_visual_honeytoken_generation()
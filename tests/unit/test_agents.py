@@ -8,6 +8,7 @@ Owner: Agents Track (Aria)
 Run with: pytest tests/unit/test_agents.py -v
 """
 
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, mock_open
@@ -22,13 +23,33 @@ from backend.core.agents import (
     load_prompt,
     load_tool,
     get_agent,
+    clean_response,
     execute_agent,
     get_fallback_response,
     AgentRequest,
     _get_hardcoded_config,
     _get_hardcoded_fallback,
     _create_noop_tool,
+    _load_yaml_cached,
+    get_session_context,
+    warm_agent_caches,
 )
+from backend.core import agents
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_caches():
+    """Start each test with cold caches - several tests patch open()."""
+    caches = (agents._read_prompt, agents.load_tool, agents._create_noop_tool)
+    agents._yaml_cache.clear()
+    agents._agent_spec_cache.clear()
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    agents._yaml_cache.clear()
+    agents._agent_spec_cache.clear()
+    for cached in caches:
+        cached.cache_clear()
 
 
 # ============================================================
@@ -67,6 +88,90 @@ class TestAgentRequestModel:
             AgentRequest()
 
 
+# ============================================================
+# TEST: get_session_context
+# ============================================================
+
+@pytest.fixture
+def fingerprint_log(tmp_path, monkeypatch):
+    """Point the agents module at an empty temp logs/fingerprints.jsonl."""
+    monkeypatch.setattr(agents, "ROOT", tmp_path)
+    (tmp_path / "logs").mkdir()
+    return tmp_path / "logs" / "fingerprints.jsonl"
+
+
+@pytest.mark.unit
+@pytest.mark.agents_track
+class TestSessionContext:
+    """Test prior-interaction lookup for honeypot coordination."""
+
+    def test_returns_most_recent_matches_in_order(self, fingerprint_log):
+        """Only the last `limit` entries for the session, oldest first."""
+        entries = [
+            {"session_id": "s1" if i % 2 else "s2", "source_agent": f"a{i}", "message": f"m{i}"}
+            for i in range(10)
+        ]
+        fingerprint_log.write_text(
+            "\n".join(json.dumps(e) for e in entries) + "\nnot json\n"
+        )
+
+        context = get_session_context("s1", limit=2)
+
+        lines = context.splitlines()
+        assert len(lines) == 3
+        assert "To a7:" in lines[1]
+        assert "To a9:" in lines[2]
+
+    def test_picks_up_appended_lines_only_once_complete(self, fingerprint_log):
+        """New lines are indexed on the next call; a partial line waits."""
+        fingerprint_log.write_text(json.dumps({"session_id": "s1", "source_agent": "a0"}) + "\n")
+        assert "To a0:" in get_session_context("s1")
+
+        with open(fingerprint_log, "a") as f:
+            f.write(json.dumps({"session_id": "s1", "source_agent": "a1"}) + "\n")
+            f.write('{"session_id": "s1", "source_')
+        assert get_session_context("s1").count("- To ") == 2
+
+        with open(fingerprint_log, "a") as f:
+            f.write('agent": "a2"}\n')
+        assert "To a2:" in get_session_context("s1").splitlines()[-1]
+
+    def test_sessionless_lines_are_not_parsed(self, fingerprint_log):
+        """Entries without a session id are skipped before JSON decoding."""
+        fingerprint_log.write_text(
+            '{"source_agent": "a0", "session_id": null}\n'
+            '{"source_agent": "a1"}\n'
+            + json.dumps({"session_id": "s1", "source_agent": "a2"}) + "\n"
+        )
+
+        with patch("backend.core.agents.orjson.loads", wraps=agents.orjson.loads) as loads:
+            context = get_session_context("s1")
+
+        assert loads.call_count == 1
+        assert "To a2:" in context
+
+    def test_missing_log_returns_empty(self, fingerprint_log):
+        """No log file yet means no context."""
+        assert get_session_context("s1") == ""
+
+    def test_unknown_session_returns_empty(self, fingerprint_log):
+        """No matching entries means no context."""
+        fingerprint_log.write_text(json.dumps({"session_id": "other"}) + "\n")
+        assert get_session_context("s1") == ""
+
+    def test_session_count_is_bounded(self, fingerprint_log, monkeypatch):
+        """Only the most recently active sessions stay indexed."""
+        monkeypatch.setattr(agents, "_session_index", agents.LRUCache(maxsize=2))
+        fingerprint_log.write_text("".join(
+            json.dumps({"session_id": f"s{i}", "source_agent": f"a{i}"}) + "\n"
+            for i in range(3)
+        ))
+
+        assert get_session_context("s0") == ""
+        assert "To a2:" in get_session_context("s2")
+        assert len(agents._session_index) == 2
+
+
 # ============================================================
 # TEST: load_agent_config
 # ============================================================
@@ -161,6 +266,34 @@ class TestLoadAgentConfig:
         assert "description" in config
 
 
+# ============================================================
+# TEST: YAML config cache
+# ============================================================
+
+@pytest.mark.unit
+@pytest.mark.agents_track
+class TestYamlConfigCache:
+    """Test that config files are parsed once per change."""
+
+    def test_repeat_load_skips_parse(self):
+        """Second load of an unchanged file should reuse the parsed dict."""
+        with patch("backend.core.agents.yaml.load", wraps=yaml.load) as mock_load:
+            first = load_agent_config("real")
+            second = load_agent_config("honeypot_db_admin")
+
+        assert mock_load.call_count == 1
+        assert first["name"] and second["name"]
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Editing the file should invalidate the cached parse."""
+        path = tmp_path / "config.yaml"
+        path.write_text("value: 1\n")
+        assert _load_yaml_cached(path) == {"value": 1}
+
+        path.write_text("value: 22\n")
+        assert _load_yaml_cached(path) == {"value": 22}
+
+
 # ============================================================
 # TEST: load_prompt
 # ============================================================
@@ -230,6 +363,14 @@ class TestLoadPrompt:
             assert isinstance(prompt, str)
             assert len(prompt) > 0
 
+    def test_load_prompt_reuses_cached_text(self):
+        """Repeat loads of an unchanged prompt should not reopen the file."""
+        first = load_prompt("prompts/real-agent.md")
+        with patch("builtins.open", side_effect=AssertionError("file reopened")):
+            second = load_prompt("prompts/real-agent.md")
+
+        assert second is first
+
 
 # ============================================================
 # TEST: load_tool
@@ -295,6 +436,14 @@ class TestLoadTool:
             assert callable(tool)
             assert "fallback" in tool.__name__
 
+    def test_load_tool_is_memoized(self):
+        """Repeat lookups should not go back through importlib."""
+        first = load_tool("log_interaction")
+        with patch("importlib.import_module", side_effect=AssertionError("re-imported")):
+            second = load_tool("log_interaction")
+
+        assert second is first
+
     def test_noop_tool_creation(self):
         """Test _create_noop_tool helper."""
         noop = _create_noop_tool("test_tool")
@@ -354,6 +503,29 @@ class TestGetAgent:
             tools = call_kwargs["tools"]
             assert tools is None or isinstance(tools, list)
 
+    def test_get_agent_reuses_spec_but_not_agent(self):
+        """Warm calls skip config resolution yet still build a fresh Agent."""
+        with patch("backend.core.agents.Agent") as MockAgent:
+            MockAgent.side_effect = lambda **kwargs: MagicMock()
+            first = get_agent("honeypot_db_admin")
+
+            with patch("backend.core.agents.load_agent_config") as mock_config:
+                second = get_agent("honeypot_db_admin")
+
+            mock_config.assert_not_called()
+            assert first is not second
+            assert MockAgent.call_args_list[0] == MockAgent.call_args_list[1]
+
+    def test_warm_agent_caches_prefills_specs(self):
+        """After warming, building a configured agent needs no config lookup."""
+        warm_agent_caches()
+
+        with patch("backend.core.agents.Agent"), \
+                patch("backend.core.agents.load_agent_config") as mock_config:
+            get_agent("honeypot_privileged")
+
+        mock_config.assert_not_called()
+
     def test_get_agent_real_has_no_tools(self):
         """Test that real agent has no tools."""
         with patch("backend.core.agents.Agent") as MockAgent:
@@ -369,6 +541,30 @@ class TestGetAgent:
             assert tools is None
 
 
+# ============================================================
+# TEST: clean_response
+# ============================================================
+
+@pytest.mark.unit
+@pytest.mark.agents_track
+class TestCleanResponse:
+    """Test stripping of thinking tags and meta-commentary."""
+
+    def test_strips_thinking_block(self):
+        """Thinking tags and their content are removed across lines."""
+        text = "<thinking>plan\nmore</thinking>Access granted."
+        assert clean_response(text) == "Access granted."
+
+    def test_drops_meta_first_line_only(self):
+        """A leading meta line goes; later lines that look similar stay."""
+        text = "I'm using the lookup tool\n\nHere you go.\nLet me know if needed."
+        assert clean_response(text) == "Here you go.\nLet me know if needed."
+
+    def test_keeps_plain_response(self):
+        """Ordinary replies pass through unchanged."""
+        assert clean_response("  Connected to prod-db.  \n") == "Connected to prod-db."
+
+
 # ============================================================
 # TEST: execute_agent
 # ============================================================
@@ -437,6 +633,22 @@ class TestExecuteAgent:
             assert "Test message" in call_args
             assert "Context:" in call_args
 
+    @pytest.mark.asyncio
+    async def test_execute_agent_appends_session_context(self):
+        """Session intel goes after the user's message, never before it."""
+        request = AgentRequest(message="Test message", session_id="s1")
+
+        with patch("backend.core.agents.get_agent") as mock_get_agent, \
+                patch("backend.core.agents.get_session_context", return_value="[INTEL]"):
+            mock_agent = MagicMock(return_value="ok")
+            mock_get_agent.return_value = mock_agent
+
+            await execute_agent("honeypot_db_admin", request)
+
+            call_args = mock_agent.call_args[0][0]
+            assert call_args.startswith("Test message")
+            assert call_args.endswith("[INTEL]")
+
     @pytest.mark.asyncio
     async def test_execute_agent_fallback_on_exception(self):
         """Test fallback when agent execution fails."""
@@ -500,6 +712,23 @@ class TestExecuteAgent:
             # Verify it's the agent fallback, not a crash
             assert result["status"] in ["accepted", "acknowledged", "success"]
 
+    @pytest.mark.asyncio
+    async def test_execute_agent_joins_text_content_blocks(self):
+        """Text blocks of a Strands message are joined; tool blocks are skipped."""
+        request = AgentRequest(message="Test")
+
+        with patch("backend.core.agents.get_agent") as mock_get_agent:
+            mock_response = MagicMock()
+            mock_response.message = {
+                "role": "assistant",
+                "content": [{"text": "Access "}, {"toolUse": {}}, {"text": "granted."}],
+            }
+            mock_get_agent.return_value = MagicMock(return_value=mock_response)
+
+            result = await execute_agent("real", request)
+
+            assert result == {"status": "success", "response": "Access granted."}
+
 
 # ============================================================
 # TEST: get_fallback_response
@@ -0,0 +1,198 @@
+"""
+Unit tests for the API gateway (backend/api/main.py)
+
+Run with: pytest tests/unit/test_api.py -v
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+import yaml
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from backend.api import main
+from backend.core.identity import Identity
+
+
+# ============================================================
+# TEST: Token validation cache
+# ============================================================
+
+@pytest.mark.unit
+class TestTokenCache:
+    """Test caching of bearer token validation."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        main._tok_cache.clear()
+        main._tok_neg_cache.clear()
+        yield
+        main._tok_cache.clear()
+        main._tok_neg_cache.clear()
+
+    async def test_valid_token_is_cached(self):
+        """A token far from expiry is validated once."""
+        identity = Identity(valid=True, agent_id="agent-001", raw_claims={"exp": time.time() + 3600})
+
+        with patch.object(main, "validate_token_async", AsyncMock(return_value=identity)) as validate:
+            assert await main._cached_validate("Bearer abc") is identity
+            assert await main._cached_validate("Bearer abc") is identity
+
+        validate.assert_awaited_once()
+
+    async def test_expired_token_is_not_served_from_cache(self):
+        """A token whose exp has passed is revalidated, not reused."""
+        identity = Identity(valid=True, agent_id="agent-001", raw_claims={"exp": time.time() - 1})
+
+        with patch.object(main, "validate_token_async", AsyncMock(return_value=identity)) as validate:
+            await main._cached_validate("Bearer abc")
+            await main._cached_validate("Bearer abc")
+
+        assert validate.await_count == 2
+
+
+# ============================================================
+# TEST: Startup banner
+# ============================================================
+
+@pytest.mark.unit
+def test_banner_logger_emits_info_without_root_config():
+    """The banner shows under the uvicorn CLI, which leaves the root logger alone."""
+    assert main.logger.isEnabledFor(logging.INFO)
+    assert main.logger.handlers
+
+
+# ============================================================
+# TEST: Route fallbacks
+# ============================================================
+
+@pytest.mark.unit
+class TestRouteFallbacks:
+    """Test that failing routes answer with their canned body, CORS intact."""
+
+    def test_agent_request_fallback_keeps_cors(self):
+        """A crash in the agent flow returns the plausible 200, readable cross-origin."""
+        client = TestClient(main.app)
+        origin = main.FRONTEND_ORIGINS[0]
+
+        with patch.object(main, "execute_agent", AsyncMock(side_effect=RuntimeError("boom"))):
+            response = client.post(
+                "/agent/request",
+                json={"message": "hello"},
+                headers={"Origin": origin},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "acknowledged",
+            "response": "Request acknowledged. Processing in background.",
+        }
+        assert response.headers["access-control-allow-origin"] == origin
+
+    def test_agents_status_malformed_config(self, monkeypatch):
+        """A broken agents.yaml answers with the canned agent list."""
+        monkeypatch.setitem(main._agents_cache, "mtime", None)
+        client = TestClient(main.app)
+
+        with patch.object(main, "_build_agents_payload", side_effect=yaml.YAMLError("bad")):
+            response = client.get("/agents/status")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+
+    def test_fingerprints_unreadable_log(self, monkeypatch, tmp_path):
+        """A log that can't be read answers with an empty list."""
+        log = tmp_path / "fingerprints.jsonl"
+        log.write_text("")
+        monkeypatch.setattr(main, "FINGERPRINTS_LOG", log)
+        client = TestClient(main.app)
+
+        with patch.object(main, "_read_jsonl_tail", side_effect=PermissionError("denied")):
+            response = client.get("/fingerprints")
+
+        assert response.status_code == 200
+        assert response.json() == {"total": 0, "fingerprints": []}
+
+    @pytest.mark.parametrize("error", [KeyError("data"), ValueError("bad json")])
+    def test_visual_honeytoken_fallback_has_canary(self, error):
+        """A malformed provider response still yields a trackable placeholder."""
+        client = TestClient(main.app)
+
+        with patch.object(main, "generate_visual_honeytoken", side_effect=error):
+            response = client.post("/visual-honeytoken")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["source"] == "fallback"
+        assert data["canary_id"].startswith("img-")
+
+
+# ============================================================
+# TEST: Scripted demo stream
+# ============================================================
+
+async def _run_response(response) -> list[bytes]:
+    """Drive an ASGI response to completion and return its body chunks."""
+    chunks = []
+
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            chunks.append(message["body"])
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}, "method": "GET", "path": "/demo/events"}
+    await response(scope, receive, send)
+    return chunks
+
+
+@pytest.mark.unit
+class TestDemoEvents:
+    """Test the one-demo-at-a-time guard on /demo/events."""
+
+    @pytest.fixture(autouse=True)
+    def fake_demo(self, monkeypatch):
+        async def demo():
+            yield b"event: demo_start\ndata: {}\n\n"
+            # Still running while the other viewer connects
+            await asyncio.sleep(0.05)
+
+        monkeypatch.setattr(main, "demo_event_generator", demo)
+        monkeypatch.setattr(main, "_demo_sem", asyncio.Semaphore(1))
+
+    async def test_overlapping_viewers(self):
+        """Of two viewers connecting together, one gets the demo and one the busy notice."""
+        first = await main.demo_events()
+        second = await main.demo_events()
+
+        bodies = await asyncio.gather(_run_response(first), _run_response(second))
+
+        assert sorted(bodies) == sorted([[b"event: demo_start\ndata: {}\n\n"], [main.DEMO_BUSY_FRAME]])
+        # The demo stream released the semaphore when it ended
+        assert not main._demo_sem.locked()
+
+    async def test_disconnect_before_start_releases_nothing(self):
+        """A response that never starts streaming leaves the demo free."""
+        response = await main.demo_events()
+        await response.body_iterator.aclose()
+
+        assert not main._demo_sem.locked()
+
+    def test_stream_is_not_gzipped(self, monkeypatch):
+        """Demo frames go out uncompressed even when the client accepts gzip."""
+        async def demo():
+            for i in range(50):
+                yield b"event: log\ndata: {\"message\": \"frame %d\"}\n\n" % i
+
+        monkeypatch.setattr(main, "demo_event_generator", demo)
+        client = TestClient(main.app)
+
+        response = client.get("/demo/events", headers={"Accept-Encoding": "gzip"})
+
+        assert len(response.content) > 1000
+        assert "content-encoding" not in response.headers
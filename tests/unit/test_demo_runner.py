@@ -0,0 +1,41 @@
+"""
+Unit tests for the live demo runner (backend/core/demo_runner.py)
+
+Run with: pytest tests/unit/test_demo_runner.py -v
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from backend.core import demo_runner
+from backend.core.demo_runner import get_attack_message
+
+
+# ============================================================
+# TEST: get_attack_message cache
+# ============================================================
+
+@pytest.mark.unit
+class TestAttackMessageCache:
+    """Test reuse of generated attack messages."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        monkeypatch.setattr(demo_runner, "_attack_message_cache", demo_runner.OrderedDict())
+
+    def test_opening_turn_is_never_cached(self):
+        """Each run's first attack comes from the model, not a replay."""
+        agent = MagicMock(side_effect=["first run", "second run"])
+
+        assert get_attack_message(agent, "RECON", "db-admin-001", []) == "first run"
+        assert get_attack_message(agent, "RECON", "db-admin-001", []) == "second run"
+        assert agent.call_count == 2
+
+    def test_turn_with_history_is_cached(self):
+        """A repeated phase, target and history reuses the generated message."""
+        agent = MagicMock(return_value="probe")
+        history = [{"target": "db-admin-001", "attack": "hello", "response": "hi"}]
+
+        get_attack_message(agent, "PROBE", "db-admin-001", history)
+        assert get_attack_message(agent, "PROBE", "db-admin-001", history) == "probe"
+        agent.assert_called_once()
@@ -6,6 +6,7 @@ Run with: pytest tests/unit/test_identity.py -v
 
 import pytest
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 ROOT = Path(__file__).parent.parent.parent
 
@@ -116,3 +117,207 @@ class TestFGAIntegration:
                 break
         else:
             pytest.fail("No routing rule for FGA denial")
+
+
+@pytest.mark.unit
+@pytest.mark.identity_track
+class TestJwksCache:
+    """Test JWKS caching and refresh behavior."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_jwks_cache(self, monkeypatch):
+        from backend.core import identity
+        monkeypatch.setenv("AUTH0_DOMAIN", "tenant.example.com")
+        monkeypatch.setattr(identity, "_jwks_cache", {"data": None, "expires_at": 0.0})
+        return identity
+
+    def test_success_is_cached(self, fresh_jwks_cache):
+        """A fetched key set is reused until the TTL runs out."""
+        response = MagicMock()
+        response.json.return_value = {"keys": []}
+
+        with patch.object(fresh_jwks_cache.httpx, "get", return_value=response) as mock_get:
+            assert fresh_jwks_cache.get_jwks() == {"keys": []}
+            assert fresh_jwks_cache.get_jwks() == {"keys": []}
+
+        assert mock_get.call_count == 1
+
+    def test_failure_is_not_cached(self, fresh_jwks_cache, monkeypatch):
+        """A failed fetch is retried once the short backoff has passed."""
+        response = MagicMock()
+        response.json.return_value = {"keys": []}
+
+        with patch.object(fresh_jwks_cache.httpx, "get", side_effect=RuntimeError("down")):
+            assert fresh_jwks_cache.get_jwks() is None
+
+        monkeypatch.setattr(fresh_jwks_cache, "JWKS_RETRY_SECONDS", 0)
+        fresh_jwks_cache._jwks_cache["expires_at"] = 0.0
+        with patch.object(fresh_jwks_cache.httpx, "get", return_value=response):
+            assert fresh_jwks_cache.get_jwks() == {"keys": []}
+
+    def test_failed_refresh_keeps_last_good_keys(self, fresh_jwks_cache):
+        """An expired key set keeps serving while Auth0 is unreachable."""
+        fresh_jwks_cache._jwks_cache["data"] = {"keys": ["old"]}
+
+        with patch.object(fresh_jwks_cache.httpx, "get", side_effect=RuntimeError("down")):
+            assert fresh_jwks_cache.get_jwks() == {"keys": ["old"]}
+
+    async def test_async_fetch_uses_shared_client(self, fresh_jwks_cache):
+        """validate_token_async fetches JWKS without the blocking client."""
+        response = MagicMock()
+        response.json.return_value = {"keys": []}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+
+        with patch.object(fresh_jwks_cache, "get_async_http_client", return_value=client), \
+                patch.object(fresh_jwks_cache.httpx, "get", side_effect=AssertionError("sync fetch")):
+            identity = await fresh_jwks_cache.validate_token_async("Bearer a.b.c")
+
+        client.get.assert_awaited_once()
+        assert identity.valid is False
+
+    async def test_refresh_lock_is_per_loop(self, fresh_jwks_cache):
+        """Another loop (the sync wrapper's) refreshes while this loop holds its lock."""
+        import asyncio
+
+        response = MagicMock()
+        response.json.return_value = {"keys": []}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+
+        with patch.object(fresh_jwks_cache, "get_async_http_client", return_value=client):
+            async with fresh_jwks_cache._jwks_lock():
+                jwks = await asyncio.wait_for(
+                    asyncio.to_thread(asyncio.run, fresh_jwks_cache.get_jwks_async()), 5
+                )
+
+        assert jwks == {"keys": []}
+
+
+@pytest.mark.unit
+@pytest.mark.identity_track
+class TestFgaToken:
+    """Test FGA access token reuse."""
+
+    @pytest.fixture(autouse=True)
+    def empty_token_cache(self, monkeypatch):
+        from backend.core import identity
+        monkeypatch.setattr(identity, "_fga_tokens", {})
+        return identity
+
+    async def test_token_reused_until_expiry(self, empty_token_cache):
+        """A fresh token is fetched once and then served from memory."""
+        response = MagicMock()
+        response.json.return_value = {"access_token": "tok", "expires_in": 3600}
+        client = MagicMock()
+        client.post = AsyncMock(return_value=response)
+
+        with patch.object(empty_token_cache, "get_async_http_client", return_value=client):
+            first = await empty_token_cache.get_fga_token("id", "secret", "https://fga")
+            second = await empty_token_cache.get_fga_token("id", "secret", "https://fga")
+
+        assert first == second == "tok"
+        client.post.assert_awaited_once()
+
+    async def test_failure_returns_none(self, empty_token_cache):
+        """Token endpoint errors fall back to None (FGA then fails open)."""
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=RuntimeError("down"))
+
+        with patch.object(empty_token_cache, "get_async_http_client", return_value=client):
+            assert await empty_token_cache.get_fga_token("id", "secret", "https://fga") is None
+
+
+@pytest.mark.unit
+@pytest.mark.identity_track
+class TestFgaCheckCache:
+    """Test caching of FGA check answers."""
+
+    @pytest.fixture
+    def fga(self, monkeypatch):
+        from backend.core import identity
+        for name in ("AUTH0_FGA_STORE_ID", "AUTH0_FGA_CLIENT_ID", "AUTH0_FGA_CLIENT_SECRET"):
+            monkeypatch.setenv(name, "x")
+        monkeypatch.setattr(identity, "_fga_allow_cache", {})
+        monkeypatch.setattr(identity, "_fga_deny_cache", {})
+        monkeypatch.setattr(identity, "get_fga_token", AsyncMock(return_value="tok"))
+        return identity
+
+    async def test_answer_is_cached(self, fga):
+        """Repeat checks for the same tuple skip the network."""
+        response = MagicMock()
+        response.json.return_value = {"allowed": False}
+        client = MagicMock()
+        client.post = AsyncMock(return_value=response)
+
+        with patch.object(fga, "get_async_http_client", return_value=client):
+            assert await fga.check_fga("agent-001", "can_communicate", "swarm:a") is False
+            assert await fga.check_fga("agent-001", "can_communicate", "swarm:a") is False
+
+        client.post.assert_awaited_once()
+
+    async def test_fail_open_is_not_cached(self, fga):
+        """Errors allow the request but are retried on the next check."""
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=RuntimeError("down"))
+
+        with patch.object(fga, "get_async_http_client", return_value=client):
+            assert await fga.check_fga("agent-001", "can_communicate", "swarm:a") is True
+            assert await fga.check_fga("agent-001", "can_communicate", "swarm:a") is True
+
+        assert client.post.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.identity_track
+class TestFullIdentitySync:
+    """Test the synchronous get_full_identity wrapper."""
+
+    def test_missing_header_skips_coroutine(self):
+        """No token returns the fallback without touching the async path."""
+        from backend.core import identity
+
+        with patch.object(identity, "get_full_identity") as full:
+            result = identity.get_full_identity_sync(None)
+
+        full.assert_not_called()
+        assert result.valid is False
+        assert result.fga_allowed is False
+
+    def test_runs_without_event_loop(self):
+        """Callable from plain sync code."""
+        from backend.core import identity
+
+        expected = identity.Identity(valid=True, agent_id="agent-001", fga_allowed=True)
+        with patch.object(identity, "get_full_identity", AsyncMock(return_value=expected)):
+            assert identity.get_full_identity_sync("Bearer abc") is expected
+
+    async def test_runs_inside_event_loop(self):
+        """Callable from code already running on an event loop."""
+        from backend.core import identity
+
+        expected = identity.Identity(valid=True, agent_id="agent-001", fga_allowed=True)
+        with patch.object(identity, "get_full_identity", AsyncMock(return_value=expected)):
+            assert identity.get_full_identity_sync("Bearer abc") is expected
+
+    async def test_keeps_running_loop_client(self):
+        """The worker loop gets its own client; the caller's stays open and in place."""
+        from backend.core import identity
+
+        main_client = identity.get_async_http_client()
+        worker_clients = []
+
+        async def full_identity(auth_header, swarm_id):
+            worker_clients.append(identity.get_async_http_client())
+            return identity.Identity(valid=True, agent_id="agent-001", fga_allowed=True)
+
+        try:
+            with patch.object(identity, "get_full_identity", full_identity):
+                identity.get_full_identity_sync("Bearer abc")
+
+            assert worker_clients[0] is not main_client
+            assert worker_clients[0].is_closed
+            assert identity.get_async_http_client() is main_client
+            assert not main_client.is_closed
+        finally:
+            await identity.close_identity_clients()
@@ -6,6 +6,10 @@ Run with: pytest tests/unit/test_router.py -v
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+
+from backend.core import router
+from backend.core.identity import Identity
 
 ROOT = Path(__file__).parent.parent.parent
 
@@ -140,3 +144,46 @@ class TestRoutingLogging:
                 if "log_event" in rule:
                     assert rule["log_event"] is None
                 break
+
+
+@pytest.mark.unit
+@pytest.mark.identity_track
+class TestRoutingCache:
+    """Test memoized routing decisions."""
+
+    @pytest.fixture(autouse=True)
+    def clear_route_cache(self):
+        router._route_cache.clear()
+        yield
+        router._route_cache.clear()
+
+    def test_repeat_identity_skips_rule_load(self):
+        """Same routing key should reuse the decision without re-reading rules."""
+        identity = Identity(valid=True, fga_allowed=True, is_honeypot=False, agent_type="real")
+
+        with patch.object(router, "load_routing_rules", wraps=router.load_routing_rules) as load:
+            assert router.route_request(identity) == "real"
+            assert router.route_request(identity) == "real"
+            assert load.call_count == 1
+
+    def test_cached_trap_still_logs_every_request(self):
+        """Trap events should be logged per request even when the decision is cached."""
+        identity = Identity(valid=False)
+        before = len(router.get_routing_log())
+
+        assert router.route_request(identity) == "honeypot_db_admin"
+        assert router.route_request(identity) == "honeypot_db_admin"
+
+        log = router.get_routing_log()
+        assert log[-1]["event_type"] == "INVALID_TOKEN_TRAP"
+        assert len(log) == min(before + 2, 100)
+
+    def test_trap_profile_is_part_of_key(self):
+        """Honeypot self-routing should respect each identity's trap profile."""
+        db = Identity(valid=True, fga_allowed=True, is_honeypot=True, agent_type="honeypot",
+                      raw_claims={router.TRAP_PROFILE_CLAIM: "db-admin"})
+        priv = Identity(valid=True, fga_allowed=True, is_honeypot=True, agent_type="honeypot",
+                        raw_claims={router.TRAP_PROFILE_CLAIM: "privileged"})
+
+        assert router.route_request(db) == "honeypot_db_admin"
+        assert router.route_request(priv) == "honeypot_privileged"
@@ -1,7 +1,8 @@
 """
 Unit tests for backend/tools/
 
-Tests honeypot tools: log_interaction, fake_credential, query_patterns
+Tests honeypot tools: log_interaction, fake_credential, query_patterns,
+and CloudWatch metric batching
 
 Run with: pytest tests/unit/test_tools.py -v
 
@@ -21,6 +22,11 @@ from pathlib import Path
 from backend.tools.log_interaction import log_interaction
 from backend.tools.fake_credential import fake_credential
 from backend.tools.query_patterns import query_patterns
+from backend.tools.cloudwatch_metrics import (
+    MetricBatcher,
+    build_threat_metrics,
+    build_fingerprint_metric,
+)
 
 
 ROOT = Path(__file__).parent.parent.parent
@@ -72,7 +78,7 @@ class TestLogInteraction:
         written_content = m().write.call_args[0][0]
 
         # Should be valid JSON followed by newline
-        assert written_content.endswith("\n")
+        assert written_content.endswith(b"\n")
         log_entry = json.loads(written_content.strip())
 
         # Verify all required fields
@@ -466,6 +472,55 @@ class TestQueryPatterns:
             assert isinstance(item, dict)
 
 
+# ============================================================
+# CLOUDWATCH METRIC BATCHING TESTS
+# ============================================================
+
+@pytest.mark.unit
+@pytest.mark.agents_track
+class TestMetricBatcher:
+    """Test MetricBatcher coalescing of PutMetricData calls."""
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_single_call(self):
+        """Test that buffered metrics go out in one PutMetricData call."""
+        batcher = MetricBatcher()
+        batcher.add(*build_threat_metrics("HIGH", attack_phase="PROBE", attacker_id="a-1"))
+        batcher.add(build_fingerprint_metric("HIGH", "Credential Harvesting"))
+
+        mock_client = MagicMock()
+        with patch("backend.tools.cloudwatch_metrics._get_cloudwatch_client", return_value=mock_client):
+            result = await batcher.flush()
+
+        assert result is True
+        mock_client.put_metric_data.assert_called_once()
+        assert len(mock_client.put_metric_data.call_args[1]["MetricData"]) == 6
+        assert len(batcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_empty_is_noop(self):
+        """Test that flushing an empty batcher makes no AWS call."""
+        batcher = MetricBatcher()
+
+        mock_client = MagicMock()
+        with patch("backend.tools.cloudwatch_metrics._get_cloudwatch_client", return_value=mock_client):
+            result = await batcher.flush()
+
+        assert result is True
+        mock_client.put_metric_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_doesnt_raise(self):
+        """Test that CloudWatch errors are swallowed."""
+        batcher = MetricBatcher()
+        batcher.add(build_fingerprint_metric("LOW"))
+
+        with patch("backend.tools.cloudwatch_metrics._get_cloudwatch_client", side_effect=Exception("No credentials")):
+            result = await batcher.flush()
+
+        assert result is False
+
+
 # ============================================================
 # TOOL INTEGRATION TESTS
 # ============================================================